@@ -0,0 +1,64 @@
+"""Compiled kernels for validator.py's region checks.
+
+Coordinates are packed into int64 keys ``(q << 32) | (r & 0xFFFFFFFF)`` and
+looked up by binary search in a sorted key array, so the traversal touches
+only one flat integer array (8 bytes per hex instead of a tuple in a set).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional (the "fast" extra)
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+# Axial neighbor offsets, same order as hex_coords.HEX_NEIGHBOR_OFFSETS
+_DQ = (1, 1, 0, -1, -1, 0)
+_DR = (0, -1, -1, 0, 1, 1)
+
+
+def pack_key(q, r):
+    """Pack axial coordinates (ints or int64 arrays) into one sortable int64 key."""
+    return (q << 32) | (r & 0xFFFFFFFF)
+
+
+def _connected_count_kernel(keys: np.ndarray) -> int:
+    """Number of hexes reachable from the first one.
+
+    ``keys`` is a sorted array of unique packed coordinates (see pack_key),
+    e.g. from ``np.unique``; neighbours are found by binary search in it.
+    """
+    n = keys.shape[0]
+    if n == 0:
+        return 0
+
+    visited = np.zeros(n, dtype=np.bool_)
+    stack = np.empty(n, dtype=np.int64)
+    visited[0] = True
+    stack[0] = 0
+    top = 1
+    count = 1
+    while top > 0:
+        top -= 1
+        key = keys[stack[top]]
+        q = key >> 32
+        r = key & 0xFFFFFFFF
+        if r >= 0x80000000:
+            r -= 0x100000000
+        for d in range(6):
+            nb = ((q + _DQ[d]) << 32) | ((r + _DR[d]) & 0xFFFFFFFF)
+            j = np.searchsorted(keys, nb)
+            if j < n and keys[j] == nb and not visited[j]:
+                visited[j] = True
+                stack[top] = j
+                top += 1
+                count += 1
+    return count
+
+
+if HAS_NUMBA:
+    connected_count = njit(cache=True)(_connected_count_kernel)
+else:
+    connected_count = _connected_count_kernel
@@ -28,6 +28,10 @@ TAG_TO_TERRAIN = {
     "corrupted": Terrain.MARSH,
 }
 
+# Fitness of placeholder cluster hexes; SpeciesFitness is frozen, so one
+# validated instance is shared
+_PLACEHOLDER_FITNESS = SpeciesFitness(human=0.7, dwarf=0.5, elf=0.5)
+
 
 class WorldAssembler:
     """Assemble a complete world from a seed.
@@ -110,6 +114,15 @@ class WorldAssembler:
             total_clusters=len(assembled_clusters),
         )
 
+    def assemble_many(self, seeds: list[WorldSeed]) -> list[AssembledWorld]:
+        """Assemble several worlds in order.
+
+        One assembler serves the whole batch, so the lazily created
+        generators and the per-radius filler grid are built once and
+        reused for every seed.
+        """
+        return [self.assemble(seed) for seed in seeds]
+
     def _tagged_to_world_hex(
         self,
         tagged: TaggedHex,
@@ -243,7 +256,7 @@ class WorldAssembler:
                         elevation=200.0,
                         moisture=0.5,
                         temperature=15.0,
-                        species_fitness=SpeciesFitness(human=0.7, dwarf=0.5, elf=0.5),
+                        species_fitness=_PLACEHOLDER_FITNESS,
                         cluster_id=instance_id,
                     )
 
@@ -309,11 +322,7 @@ class WorldAssembler:
                         elevation=chex.elevation,
                         moisture=chex.moisture,
                         temperature=15.0,
-                        species_fitness=SpeciesFitness(
-                            human=chex.species_fitness.human,
-                            dwarf=chex.species_fitness.dwarf,
-                            elf=chex.species_fitness.elf,
-                        ),
+                        species_fitness=chex.species_fitness,
                     )
                     placed_hexes.add(key)
 
@@ -20,6 +20,19 @@ DEEPSEEK_API_KEY = os.environ.get("DEEPSEEK_API_KEY", "")
 DEEPSEEK_BASE_URL = "https://api.deepseek.com"
 DEEPSEEK_MODEL = "deepseek-chat"  # V3 model (reasoner returns empty)
 
+# LLM request limits
+LLM_MAX_CONCURRENCY = 8      # In-flight async requests per client
+LLM_RETRY_ATTEMPTS = 5       # Total attempts on rate limits / timeouts
+LLM_RETRY_MIN_WAIT = 1.0     # Seconds, exponential backoff with jitter
+LLM_RETRY_MAX_WAIT = 30.0
+LLM_MAX_OUTPUT_TOKENS = 8192 # Provider cap on a single completion
+LLM_HTTP_MAX_CONNECTIONS = 64 # Pooled connections shared by async requests
+LLM_HTTP_MAX_KEEPALIVE = 32
+
+# LLM response cache (opt-in: sampled generations should not repeat)
+LLM_CACHE_ENABLED = os.environ.get("WORLDGEN_LLM_CACHE", "") == "1"
+LLM_CACHE_PATH = OUTPUT_DIR / "llm_cache.db"
+
 # Generation
 DEFAULT_TARGET_SCORE = 9.0
 MAX_QUALITY_ITERATIONS = 5
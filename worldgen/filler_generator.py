@@ -3,6 +3,7 @@
 import random
 import tomllib
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +12,23 @@ from worldgen.schemas.world import WorldHex, HexMap
 from worldgen.hex_coords import get_all_neighbors, coords_to_key, key_to_coords
 
 
+# Shared by every filler hex; SpeciesFitness is frozen
+_FILLER_FITNESS = SpeciesFitness(human=0.5, dwarf=0.5, elf=0.5)
+
+
+@lru_cache(maxsize=8)
+def _positions_in_radius(world_radius: int) -> frozenset[str]:
+    """Keys of every hex within world_radius of the origin, shared across worlds."""
+    keys = set()
+    for q in range(-world_radius, world_radius + 1):
+        for r in range(-world_radius, world_radius + 1):
+            # Check hex is within world bounds (using axial distance)
+            s = -q - r
+            if max(abs(q), abs(r), abs(s)) <= world_radius:
+                keys.add(coords_to_key(q, r))
+    return frozenset(keys)
+
+
 @dataclass
 class WaveCell:
     """Wave function cell for constraint propagation."""
@@ -123,18 +141,7 @@ class FillerGenerator:
         world_radius: int,
     ) -> set[str]:
         """Find all empty hex positions within world radius."""
-        empty = set()
-
-        for q in range(-world_radius, world_radius + 1):
-            for r in range(-world_radius, world_radius + 1):
-                # Check hex is within world bounds (using axial distance)
-                s = -q - r
-                if max(abs(q), abs(r), abs(s)) <= world_radius:
-                    key = coords_to_key(q, r)
-                    if key not in fixed:
-                        empty.add(key)
-
-        return empty
+        return set(_positions_in_radius(world_radius) - fixed)
 
     def _initialize_wave(
         self,
@@ -349,5 +356,5 @@ class FillerGenerator:
             elevation=elevation,
             moisture=0.4 + random.random() * 0.2,
             temperature=15.0,
-            species_fitness=SpeciesFitness(human=0.5, dwarf=0.5, elf=0.5),
+            species_fitness=_FILLER_FITNESS,
         )
@@ -1,37 +1,224 @@
 """DeepSeek LLM client wrapper using OpenAI-compatible API."""
 
-import json
+import asyncio
+import hashlib
+import re
+import sqlite3
+import threading
+from pathlib import Path
 from typing import Optional
 
-from openai import OpenAI
+import httpx
+import orjson
+from openai import (
+    APITimeoutError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    OpenAI,
+    RateLimitError,
+)
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from worldgen import config
 
+DEFAULT_SYSTEM_PROMPT = "You are a world generator for Arc Citadel. Output ONLY valid JSON, no markdown."
+
+# The whole opening fence line (any language tag), then an optional bare
+# "json" prefix, and the closing fence; stripped from LLM output in one pass
+_FENCE_RE = re.compile(
+    r"\A\s*(?:```[^\n]*\n?)?\s*(?:json(?=[\s{\[]))?|\s*```\s*\Z",
+    re.IGNORECASE,
+)
+
+# Transient provider errors worth retrying with backoff
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError)
+
+
+class ResponseCache:
+    """SQLite key-value store of raw LLM responses keyed by request hash.
+
+    The connection is shared across threads (async calls may run on another
+    thread's event loop), so every statement runs under ``_lock``.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def key(request: dict) -> str:
+        """Hash a chat completion request (model, temperature, prompts, ...)."""
+        return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, content: str) -> None:
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)",
+                (key, content),
+            )
+
 
 class DeepSeekClient:
-    """Wrapper for DeepSeek API via OpenAI-compatible client."""
+    """Wrapper for DeepSeek API via OpenAI-compatible client.
+
+    The ``a``-prefixed methods are async twins of the sync ones, backed by
+    an ``AsyncOpenAI`` client created on first use, so callers can overlap
+    several requests with ``asyncio.gather``.
+
+    Requests are retried with exponential backoff on rate limits and
+    timeouts, and async requests are capped at ``max_concurrency`` in flight.
+
+    With ``cache`` enabled, responses are stored on disk keyed by the full
+    request, and identical requests are answered without an API call.
+
+    Pass ``http_client`` to share one connection pool between sync clients.
+    Async requests on an event loop share one pooled client, which the client
+    owns unless ``async_http_client`` is given. httpx async pools are tied to
+    the loop they were first used on, so ``await aclose()`` on that loop when
+    done with it, and only pass ``async_http_client`` when all async calls
+    run on a single long-lived loop.
+    """
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[bool] = None,
+        cache_path: Optional[Path] = None,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.api_key = api_key or config.DEEPSEEK_API_KEY
         self.base_url = base_url or config.DEEPSEEK_BASE_URL
         self.model = model or config.DEEPSEEK_MODEL
+        self.max_concurrency = max_concurrency or config.LLM_MAX_CONCURRENCY
 
         if not self.api_key:
             raise ValueError("DEEPSEEK_API_KEY not set")
 
-        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        # max_retries=0: tenacity (_retry_policy) is the only retry layer
+        client_kwargs = {"api_key": self.api_key, "base_url": self.base_url, "max_retries": 0}
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+        self.client = OpenAI(**client_kwargs)
+
+        use_cache = config.LLM_CACHE_ENABLED if cache is None else cache
+        self._cache: Optional[ResponseCache] = (
+            ResponseCache(cache_path or config.LLM_CACHE_PATH) if use_cache else None
+        )
+
+        # Caller-owned async pool; never closed by this client
+        self._async_http_client = async_http_client
+
+        # Async client and semaphore are bound to the event loop that created them
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    def _bind_loop(self) -> None:
+        """(Re)create loop-bound async state for the running event loop.
+
+        A client left over from a previous loop cannot be closed from this one;
+        callers that switch loops should ``await aclose()`` on the old loop first.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                max_retries=0,
+                http_client=self._async_http_client or DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=config.LLM_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=config.LLM_HTTP_MAX_KEEPALIVE,
+                    )
+                ),
+            )
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+
+    async def aclose(self) -> None:
+        """Close the async client's connection pool (unless caller-owned).
+
+        Must run on the loop the async client was used on.
+        """
+        if self._async_client is not None and self._async_http_client is None:
+            await self._async_client.close()
+        self._loop = None
+        self._async_client = None
+        self._sem = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        self._bind_loop()
+        return self._async_client
+
+    def _request(
+        self,
+        prompt: str,
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict],
+    ) -> dict:
+        """Build chat completion arguments."""
+        request = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if response_format is not None:
+            request["response_format"] = response_format
+        return request
+
+    def _cache_lookup_key(self, request: dict, bypass_cache: bool) -> Optional[str]:
+        """Cache key for a request, or None when caching does not apply."""
+        if self._cache is None or bypass_cache:
+            return None
+        return ResponseCache.key(request)
+
+    def _retry_policy(self) -> dict:
+        """Backoff settings shared by the sync and async retry loops."""
+        return {
+            "wait": wait_random_exponential(
+                min=config.LLM_RETRY_MIN_WAIT, max=config.LLM_RETRY_MAX_WAIT
+            ),
+            "stop": stop_after_attempt(config.LLM_RETRY_ATTEMPTS),
+            "retry": retry_if_exception_type(RETRYABLE_ERRORS),
+            "reraise": True,
+        }
 
     def generate(
         self,
         prompt: str,
-        system_prompt: str = "You are a world generator for Arc Citadel. Output ONLY valid JSON, no markdown.",
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
         temperature: float = 0.9,
         max_tokens: int = 2000,
+        response_format: Optional[dict] = None,
+        bypass_cache: bool = False,
     ) -> str:
         """Generate content from prompt.
 
@@ -40,25 +227,33 @@ class DeepSeekClient:
             system_prompt: System instructions for the model.
             temperature: Sampling temperature (0.0-2.0).
             max_tokens: Maximum tokens in the response.
+            response_format: Optional provider response format,
+                e.g. ``{"type": "json_object"}``.
+            bypass_cache: Always call the API, even on a cache hit.
 
         Returns:
             The generated content as a string.
         """
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt},
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
-        return response.choices[0].message.content or ""
+        request = self._request(prompt, system_prompt, temperature, max_tokens, response_format)
+        cache_key = self._cache_lookup_key(request, bypass_cache)
+        if cache_key is not None:
+            hit = self._cache.get(cache_key)
+            if hit is not None:
+                return hit
+
+        for attempt in Retrying(**self._retry_policy()):
+            with attempt:
+                response = self.client.chat.completions.create(**request)
+        content = response.choices[0].message.content or ""
+
+        if cache_key is not None:
+            self._cache.set(cache_key, content)
+        return content
 
     def generate_json(
         self,
         prompt: str,
-        system_prompt: str = "You are a world generator for Arc Citadel. Output ONLY valid JSON, no markdown.",
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
         temperature: float = 0.9,
         max_tokens: int = 2000,
     ) -> dict:
@@ -79,6 +274,174 @@ class DeepSeekClient:
         content = self.generate(prompt, system_prompt, temperature, max_tokens)
         return self._clean_and_parse_json(content)
 
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: float = 0.9,
+        max_tokens: int = 2000,
+        response_format: Optional[dict] = None,
+        bypass_cache: bool = False,
+    ) -> str:
+        """Async version of generate()."""
+        request = self._request(prompt, system_prompt, temperature, max_tokens, response_format)
+        cache_key = self._cache_lookup_key(request, bypass_cache)
+        if cache_key is not None:
+            hit = self._cache.get(cache_key)
+            if hit is not None:
+                return hit
+
+        client = self.async_client
+        async for attempt in AsyncRetrying(**self._retry_policy()):
+            with attempt:
+                async with self._sem:
+                    response = await client.chat.completions.create(**request)
+        content = response.choices[0].message.content or ""
+
+        if cache_key is not None:
+            self._cache.set(cache_key, content)
+        return content
+
+    async def agenerate_json(
+        self,
+        prompt: str,
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: float = 0.9,
+        max_tokens: int = 2000,
+    ) -> dict:
+        """Async version of generate_json()."""
+        content = await self.agenerate(prompt, system_prompt, temperature, max_tokens)
+        return self._clean_and_parse_json(content)
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: float = 0.9,
+        max_tokens: int = 2000,
+    ) -> dict:
+        """Stream a JSON response and parse it as soon as it is complete.
+
+        Tracks brace depth (ignoring braces inside strings) while chunks
+        arrive, and stops reading once the top-level object or array closes,
+        so trailing tokens are never waited for. Responses are not cached.
+
+        Args:
+            prompt: The user prompt to send to the model.
+            system_prompt: System instructions for the model.
+            temperature: Sampling temperature (0.0-2.0).
+            max_tokens: Maximum tokens in the response.
+
+        Returns:
+            The parsed JSON as a dictionary.
+
+        Raises:
+            json.JSONDecodeError: If the response cannot be parsed as JSON.
+        """
+        request = self._request(prompt, system_prompt, temperature, max_tokens, None)
+        request["stream"] = True
+        for attempt in Retrying(**self._retry_policy()):
+            with attempt:
+                stream = self.client.chat.completions.create(**request)
+
+        buffer: list[str] = []
+        depth = 0
+        in_string = False
+        escaped = False
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                piece = chunk.choices[0].delta.content or ""
+                for i, ch in enumerate(piece):
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif ch == "\\":
+                            escaped = True
+                        elif ch == '"':
+                            in_string = False
+                    elif ch == '"':
+                        in_string = True
+                    elif ch in "{[":
+                        depth += 1
+                    elif ch in "}]" and depth > 0:
+                        depth -= 1
+                        if depth == 0:
+                            buffer.append(piece[: i + 1])
+                            return self._clean_and_parse_json("".join(buffer))
+                buffer.append(piece)
+        finally:
+            stream.close()
+
+        return self._clean_and_parse_json("".join(buffer))
+
+    def generate_json_batch(
+        self,
+        prompt: str,
+        n: int,
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: float = 0.9,
+        max_tokens: int = 2000,
+    ) -> list[dict]:
+        """Generate N JSON candidates for the same prompt in one request.
+
+        The shared prompt is sent (and billed) once instead of N times.
+
+        Args:
+            prompt: The user prompt to send to the model.
+            n: Number of candidates to request.
+            system_prompt: System instructions for the model.
+            temperature: Sampling temperature (0.0-2.0).
+            max_tokens: Maximum tokens per candidate.
+
+        Returns:
+            Up to N parsed candidates; the model may return fewer.
+
+        Raises:
+            json.JSONDecodeError: If the response cannot be parsed as JSON.
+        """
+        content = self.generate(
+            prompt,
+            self._batch_system_prompt(system_prompt, n),
+            temperature,
+            min(max_tokens * n, config.LLM_MAX_OUTPUT_TOKENS),
+            response_format={"type": "json_object"},
+        )
+        return self._parse_candidates(content, n)
+
+    async def agenerate_json_batch(
+        self,
+        prompt: str,
+        n: int,
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: float = 0.9,
+        max_tokens: int = 2000,
+    ) -> list[dict]:
+        """Async version of generate_json_batch()."""
+        content = await self.agenerate(
+            prompt,
+            self._batch_system_prompt(system_prompt, n),
+            temperature,
+            min(max_tokens * n, config.LLM_MAX_OUTPUT_TOKENS),
+            response_format={"type": "json_object"},
+        )
+        return self._parse_candidates(content, n)
+
+    def _batch_system_prompt(self, system_prompt: str, n: int) -> str:
+        """Extend a system prompt to ask for N candidates in one object."""
+        return (
+            f"{system_prompt}\n"
+            f'Return a JSON object {{"candidates": [...]}} containing exactly {n} '
+            f"distinct candidates, each a complete JSON answer to the request."
+        )
+
+    def _parse_candidates(self, content: str, n: int) -> list[dict]:
+        """Extract the candidate list from a batched response."""
+        data = self._clean_and_parse_json(content)
+        candidates = data.get("candidates", []) if isinstance(data, dict) else data
+        return [c for c in candidates if isinstance(c, dict)][:n]
+
     def _clean_and_parse_json(self, content: str) -> dict:
         """Clean up common JSON issues from LLM output.
 
@@ -91,21 +454,4 @@ class DeepSeekClient:
         Raises:
             json.JSONDecodeError: If the content cannot be parsed as JSON.
         """
-        content = content.strip()
-
-        # Remove markdown code blocks
-        if content.startswith("```"):
-            lines = content.split("\n")
-            # Remove first line (```json or ```)
-            lines = lines[1:]
-            # Remove last line if it's closing ```
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            content = "\n".join(lines)
-
-        # Handle case where json is on the same line as ```
-        if content.startswith("json"):
-            content = content[4:]
-
-        content = content.strip()
-        return json.loads(content)
+        return orjson.loads(_FENCE_RE.sub("", content).strip())
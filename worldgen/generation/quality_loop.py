@@ -1,14 +1,23 @@
 """Quality-focused generation with iterative improvement."""
 
-import json
+import asyncio
+import hashlib
+import threading
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+import httpx
+import msgspec
+import orjson
+
 from worldgen import config
 from worldgen.schemas import ComponentCategory
 from .llm_client import DeepSeekClient
 
+SCORING_SYSTEM_PROMPT = "You are a harsh but fair game design critic. A 9/10 is genuinely excellent. Most things are 5-7."
+
 
 @dataclass
 class GenerationStats:
@@ -29,44 +38,48 @@ class GenerationStats:
         self.avg_final_score = sum(self.scores) / len(self.scores)
 
 
-@dataclass
-class ScoringResult:
+class ScoringResult(msgspec.Struct, frozen=True):
     """Result from scoring an asset."""
 
-    strategic_score: float
-    narrative_score: float
-    authenticity_score: float
-    sensory_score: float
-    overall_score: float
-    strengths: list[str]
-    weaknesses: list[str]
-    improvement_suggestions: list[str]
+    strategic_score: float = 0.0
+    narrative_score: float = 0.0
+    authenticity_score: float = 0.0
+    sensory_score: float = 0.0
+    overall_score: float = 0.0
+    strengths: list[str] = []
+    weaknesses: list[str] = []
+    improvement_suggestions: list[str] = []
 
     @classmethod
     def from_dict(cls, data: dict) -> "ScoringResult":
         """Create from dictionary (LLM response)."""
-        return cls(
-            strategic_score=float(data.get("strategic_score", 0)),
-            narrative_score=float(data.get("narrative_score", 0)),
-            authenticity_score=float(data.get("authenticity_score", 0)),
-            sensory_score=float(data.get("sensory_score", 0)),
-            overall_score=float(data.get("overall_score", 0)),
-            strengths=data.get("strengths", []),
-            weaknesses=data.get("weaknesses", []),
-            improvement_suggestions=data.get("improvement_suggestions", []),
-        )
+        return msgspec.convert(data, cls, strict=False)
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    """Stop a generator's background event loop and wait for its thread."""
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is threading.current_thread():
+        return
+    thread.join()
+    loop.close()
 
 
 class QualityGenerator:
     """Generate assets with iterative quality improvement.
 
     The quality loop works as follows:
-    1. Generate N candidates per round
-    2. Score each candidate
+    1. Generate N candidates per round (in one batched request)
+    2. Score all candidates (in one batched request)
     3. Pick the best scoring candidate
     4. If score >= target, return it
     5. Otherwise, create improvement prompt with feedback and iterate
     6. Repeat until target score reached or max iterations exhausted
+
+    The sync wrappers run on a background event loop thread started on first
+    use. Call ``close()`` (or use the generator as a context manager) to close
+    the client's connection pool and stop it; a generator that is garbage
+    collected or still open at exit only has its loop stopped.
     """
 
     def __init__(
@@ -75,6 +88,7 @@ class QualityGenerator:
         max_iterations: int = config.MAX_QUALITY_ITERATIONS,
         candidates_per_round: int = config.CANDIDATES_PER_ROUND,
         client: Optional[DeepSeekClient] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize the quality generator.
 
@@ -83,20 +97,64 @@ class QualityGenerator:
             max_iterations: Maximum improvement iterations.
             candidates_per_round: Number of candidates to generate per round.
             client: DeepSeek client instance. If None, creates new one.
+            http_client: Shared async HTTP connection pool for the lazily
+                created client's async requests. Used only from this
+                generator's event loop; the caller closes it.
         """
         self.target_score = target_score
         self.max_iterations = max_iterations
         self.candidates_per_round = candidates_per_round
         self.client = client
+        self._http_client = http_client
+        self._client_lock = threading.Lock()
+        # Long-lived loop for the sync wrappers, so the async client and its
+        # connection pool survive across generate_with_quality() calls
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_finalizer: Optional[weakref.finalize] = None
+        # Judge verdicts keyed by content hash, so a candidate repeated in a
+        # later round is not scored twice
+        self._score_cache: dict[str, ScoringResult] = {}
 
         self.stats = GenerationStats()
 
     def _get_client(self) -> DeepSeekClient:
-        """Get or create the DeepSeek client."""
+        """Get or create the DeepSeek client, once even across threads."""
         if self.client is None:
-            self.client = DeepSeekClient()
+            with self._client_lock:
+                if self.client is None:
+                    self.client = DeepSeekClient(async_http_client=self._http_client)
         return self.client
 
+    def _run(self, coro):
+        """Run a coroutine to completion on this generator's event loop."""
+        if self._loop is None:
+            with self._client_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    thread = threading.Thread(
+                        target=loop.run_forever, name="quality-loop", daemon=True
+                    )
+                    thread.start()
+                    self._loop_finalizer = weakref.finalize(self, _stop_loop, loop, thread)
+                    self._loop = loop
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        """Close the client's async connection pool and stop the event loop."""
+        if self._loop is None:
+            return
+        if self.client is not None:
+            self._run(self.client.aclose())
+        self._loop_finalizer()
+        self._loop = None
+        self._loop_finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def _load_scoring_prompt(self) -> str:
         """Load the universal scoring prompt from file."""
         scoring_path = config.PROMPTS_DIR / "scoring.txt"
@@ -127,6 +185,55 @@ Respond with ONLY JSON:
   "improvement_suggestions": ["...", "..."]
 }}"""
 
+    def _load_batch_scoring_prompt(self) -> str:
+        """Load the batch scoring prompt from file."""
+        scoring_path = config.PROMPTS_DIR / "scoring_batch.txt"
+        if scoring_path.exists():
+            return scoring_path.read_text()
+        return self._default_batch_scoring_prompt()
+
+    def _default_batch_scoring_prompt(self) -> str:
+        """Return the default batch scoring prompt if file not found."""
+        return """Rate each of these {count} {asset_type} assets from 1-10 on:
+STRATEGIC VALUE: Does it create interesting choices? (1-10)
+NARRATIVE POTENTIAL: Does it suggest stories? (1-10)
+SPECIES AUTHENTICITY: Does it feel genuinely {species}? (1-10)
+SENSORY RICHNESS: Can you feel being there? (1-10)
+
+ASSETS:
+{assets_json}
+
+Respond with ONLY JSON, one entry per asset in the same order:
+{{
+  "scores": [
+    {{
+      "strategic_score": <1-10>,
+      "narrative_score": <1-10>,
+      "authenticity_score": <1-10>,
+      "sensory_score": <1-10>,
+      "overall_score": <1-10>,
+      "strengths": ["...", "..."],
+      "weaknesses": ["...", "..."],
+      "improvement_suggestions": ["...", "..."]
+    }}
+  ]
+}}"""
+
+    def _scoring_prompt(self, asset: dict, asset_type: str, species: str) -> str:
+        """Fill the scoring prompt template for one asset."""
+        prompt_template = self._load_scoring_prompt()
+        return prompt_template.format(
+            asset_type=asset_type,
+            species=species,
+            asset_json=orjson.dumps(asset, option=orjson.OPT_INDENT_2).decode(),
+        )
+
+    @staticmethod
+    def _score_key(asset: dict, asset_type: str, species: str) -> str:
+        """Hash of the canonical asset JSON and the scoring context."""
+        payload = orjson.dumps([asset_type, species, asset], option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
     def score_asset(
         self, asset: dict, asset_type: str, species: str = "neutral"
     ) -> ScoringResult:
@@ -138,24 +245,96 @@ Respond with ONLY JSON:
             species: The species this asset belongs to.
 
         Returns:
-            ScoringResult with all scoring dimensions.
+            ScoringResult with all scoring dimensions. Identical assets are
+            only sent to the judge once per generator.
         """
+        key = self._score_key(asset, asset_type, species)
+        if key in self._score_cache:
+            return self._score_cache[key]
+
         client = self._get_client()
-        prompt_template = self._load_scoring_prompt()
-        prompt = prompt_template.format(
-            asset_type=asset_type,
-            species=species,
-            asset_json=json.dumps(asset, indent=2),
+        result = client.generate_json(
+            prompt=self._scoring_prompt(asset, asset_type, species),
+            system_prompt=SCORING_SYSTEM_PROMPT,
+            temperature=0.3,
+            max_tokens=500,
         )
 
-        result = client.generate_json(
-            prompt=prompt,
-            system_prompt="You are a harsh but fair game design critic. A 9/10 is genuinely excellent. Most things are 5-7.",
+        score_data = self._score_cache[key] = ScoringResult.from_dict(result)
+        return score_data
+
+    async def ascore_asset(
+        self, asset: dict, asset_type: str, species: str = "neutral"
+    ) -> ScoringResult:
+        """Async version of score_asset()."""
+        key = self._score_key(asset, asset_type, species)
+        if key in self._score_cache:
+            return self._score_cache[key]
+
+        client = self._get_client()
+        result = await client.agenerate_json(
+            prompt=self._scoring_prompt(asset, asset_type, species),
+            system_prompt=SCORING_SYSTEM_PROMPT,
             temperature=0.3,
             max_tokens=500,
         )
 
-        return ScoringResult.from_dict(result)
+        score_data = self._score_cache[key] = ScoringResult.from_dict(result)
+        return score_data
+
+    async def ascore_assets_batch(
+        self, assets: list[dict], asset_type: str, species: str = "neutral"
+    ) -> list[ScoringResult]:
+        """Score several assets with a single DeepSeek request.
+
+        Args:
+            assets: The asset data dictionaries to score.
+            asset_type: Description of the asset type (e.g., "dwarf forge").
+            species: The species these assets belong to.
+
+        Returns:
+            One ScoringResult per asset, in order. May be shorter than
+            ``assets`` if the judge returned fewer scores. Assets already
+            scored by this generator are answered from cache.
+        """
+        keys = [self._score_key(a, asset_type, species) for a in assets]
+        misses: dict[str, dict] = {}
+        for key, asset in zip(keys, assets):
+            if key not in self._score_cache:
+                misses.setdefault(key, asset)
+
+        fresh: list[ScoringResult] = []
+        if misses:
+            client = self._get_client()
+            prompt = self._load_batch_scoring_prompt().format(
+                count=len(misses),
+                asset_type=asset_type,
+                species=species,
+                assets_json=orjson.dumps(
+                    list(misses.values()), option=orjson.OPT_INDENT_2
+                ).decode(),
+            )
+
+            result = await client.agenerate_json(
+                prompt=prompt,
+                system_prompt=SCORING_SYSTEM_PROMPT,
+                temperature=0.3,
+                max_tokens=min(500 * len(misses), config.LLM_MAX_OUTPUT_TOKENS),
+            )
+            fresh = msgspec.convert(
+                result.get("scores", []), list[ScoringResult], strict=False
+            )
+
+        scores: list[ScoringResult] = []
+        fresh_iter = iter(fresh)
+        for key in keys:
+            if key not in self._score_cache:
+                score_data = next(fresh_iter, None)
+                if score_data is None:
+                    break
+                self._score_cache[key] = score_data
+            scores.append(self._score_cache[key])
+        return scores
 
     def generate_with_quality(
         self,
@@ -173,7 +352,17 @@ Respond with ONLY JSON:
         Returns:
             Tuple of (best_asset, scoring_result) or (None, None) if failed.
         """
-        client = self._get_client()
+        return self._run(
+            self.agenerate_with_quality(prompt_template, asset_type, species)
+        )
+
+    async def agenerate_with_quality(
+        self,
+        prompt_template: str,
+        asset_type: str,
+        species: str,
+    ) -> tuple[Optional[dict], Optional[ScoringResult]]:
+        """Async version of generate_with_quality()."""
         best: Optional[dict] = None
         best_score_data: Optional[ScoringResult] = None
         best_score = 0.0
@@ -182,20 +371,8 @@ Respond with ONLY JSON:
         total_candidates = 0
 
         for iteration in range(self.max_iterations):
-            # Generate candidates
-            candidates: list[tuple[dict, ScoringResult, float]] = []
-
-            for _ in range(self.candidates_per_round):
-                try:
-                    candidate = client.generate_json(current_prompt)
-                    score_data = self.score_asset(candidate, asset_type, species)
-                    score = score_data.overall_score
-                    candidates.append((candidate, score_data, score))
-                    total_candidates += 1
-                except Exception as e:
-                    # Log but continue - some generations may fail
-                    print(f"    Generation failed: {e}")
-                    continue
+            candidates = await self._run_round(current_prompt, asset_type, species)
+            total_candidates += len(candidates)
 
             if not candidates:
                 continue
@@ -215,6 +392,16 @@ Respond with ONLY JSON:
                 )
                 return best, best_score_data
 
+            # Near-threshold with no feedback to act on: another round would
+            # only repeat the same prompt
+            if (
+                best_score_data is not None
+                and best_score >= self.target_score - 0.5
+                and not best_score_data.weaknesses
+                and not best_score_data.improvement_suggestions
+            ):
+                break
+
             # Build improvement prompt for next iteration
             if best_score_data is not None:
                 current_prompt = self._improvement_prompt(
@@ -227,11 +414,88 @@ Respond with ONLY JSON:
         if best is not None:
             self.stats.record_generation(
                 score=best_score,
-                iterations=self.max_iterations,
+                iterations=iteration + 1,
                 candidates=total_candidates,
             )
         return best, best_score_data
 
+    async def _run_round(
+        self, prompt: str, asset_type: str, species: str
+    ) -> list[tuple[dict, ScoringResult, float]]:
+        """Generate and score one round of candidates.
+
+        Candidates come back from a single batched request and are scored
+        by a second one, so a round normally costs two LLM calls regardless
+        of N. Candidates the batched judge failed to score fall back to
+        individual scoring.
+
+        Returns:
+            List of (candidate, score_data, score) for scored candidates.
+        """
+        client = self._get_client()
+
+        try:
+            candidates = await client.agenerate_json_batch(
+                prompt, self.candidates_per_round
+            )
+        except Exception as e:
+            # Log but continue - some generations may fail
+            print(f"    Generation failed: {e}")
+            return []
+        if not candidates:
+            return []
+
+        scores: list[ScoringResult] = []
+        try:
+            scores = await self.ascore_assets_batch(candidates, asset_type, species)
+        except Exception as e:
+            print(f"    Batch scoring failed: {e}")
+
+        results = [
+            (candidate, score_data, score_data.overall_score)
+            for candidate, score_data in zip(candidates, scores)
+        ]
+        if len(scores) < len(candidates) and not any(
+            score >= self.target_score for _, _, score in results
+        ):
+            results += await self._score_individually(
+                candidates[len(scores):], asset_type, species
+            )
+        return results
+
+    async def _score_individually(
+        self, candidates: list[dict], asset_type: str, species: str
+    ) -> list[tuple[dict, ScoringResult, float]]:
+        """Score candidates concurrently, one request each.
+
+        Results are consumed as they arrive; once one reaches the target
+        score the remaining requests are cancelled.
+        """
+        tasks = {
+            asyncio.ensure_future(self.ascore_asset(c, asset_type, species)): c
+            for c in candidates
+        }
+        results: list[tuple[dict, ScoringResult, float]] = []
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        print(f"    Scoring failed: {task.exception()}")
+                        continue
+                    score_data = task.result()
+                    results.append((tasks[task], score_data, score_data.overall_score))
+                if any(score >= self.target_score for _, _, score in results):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return results
+
     def _improvement_prompt(
         self, original_prompt: str, score: float, score_data: ScoringResult
     ) -> str:
@@ -11,6 +11,15 @@ Hex edge numbering (clockwise from East):
 
 from typing import NamedTuple
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional (the "fast" extra)
+    njit = None
+
+HAS_NUMBA = njit is not None
+
 
 class HexOffset(NamedTuple):
     """Offset for hex neighbor lookup."""
@@ -28,6 +37,13 @@ HEX_NEIGHBOR_OFFSETS: list[HexOffset] = [
     HexOffset( 0, +1),  # Edge 5: SE
 ]
 
+# Plain-tuple copies for hot-path indexing (no attribute lookups)
+_DIRS: tuple[tuple[int, int], ...] = tuple((o.dq, o.dr) for o in HEX_NEIGHBOR_OFFSETS)
+_OPPOSITE: tuple[int, ...] = (3, 4, 5, 0, 1, 2)
+
+# Same offsets as a (6, 2) array for the batched helpers
+HEX_NEIGHBOR_OFFSETS_ARRAY = np.array(HEX_NEIGHBOR_OFFSETS, dtype=np.int64)
+
 # Direction names for readability
 HEX_DIRECTIONS: dict[str, int] = {
     "E": 0,
@@ -50,8 +66,8 @@ def get_neighbor(q: int, r: int, edge: int) -> tuple[int, int]:
     Returns:
         (q, r) of neighbor hex
     """
-    offset = HEX_NEIGHBOR_OFFSETS[edge]
-    return (q + offset.dq, r + offset.dr)
+    dq, dr = _DIRS[edge]
+    return (q + dq, r + dr)
 
 
 def get_opposite_edge(edge: int) -> int:
@@ -59,7 +75,7 @@ def get_opposite_edge(edge: int) -> int:
 
     Edge 0 (E) opposite is Edge 3 (W), etc.
     """
-    return (edge + 3) % 6
+    return _OPPOSITE[edge]
 
 
 def get_all_neighbors(q: int, r: int) -> list[tuple[int, int, int]]:
@@ -68,10 +84,7 @@ def get_all_neighbors(q: int, r: int) -> list[tuple[int, int, int]]:
     Returns:
         List of (neighbor_q, neighbor_r, edge_from_center)
     """
-    return [
-        (q + offset.dq, r + offset.dr, edge)
-        for edge, offset in enumerate(HEX_NEIGHBOR_OFFSETS)
-    ]
+    return [(q + dq, r + dr, edge) for edge, (dq, dr) in enumerate(_DIRS)]
 
 
 def distance(q1: int, r1: int, q2: int, r2: int) -> int:
@@ -82,6 +95,63 @@ def distance(q1: int, r1: int, q2: int, r2: int) -> int:
     return (abs(q1 - q2) + abs(q1 + r1 - q2 - r2) + abs(r1 - r2)) // 2
 
 
+def distance_batch(
+    q1: np.ndarray, r1: np.ndarray, q2: np.ndarray, r2: np.ndarray
+) -> np.ndarray:
+    """Vectorized distance() over arrays of coordinates.
+
+    Inputs broadcast against each other, so one side may be a scalar.
+    """
+    dq = np.asarray(q1) - np.asarray(q2)
+    dr = np.asarray(r1) - np.asarray(r2)
+    return (np.abs(dq) + np.abs(dr) + np.abs(dq + dr)) // 2
+
+
+def neighbors_batch(q: np.ndarray, r: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized neighbor lookup for N hexes.
+
+    Returns:
+        (neighbor_q, neighbor_r), each shaped (6, N) and indexed by edge.
+    """
+    q = np.asarray(q)
+    r = np.asarray(r)
+    return (
+        q[np.newaxis, :] + HEX_NEIGHBOR_OFFSETS_ARRAY[:, 0:1],
+        r[np.newaxis, :] + HEX_NEIGHBOR_OFFSETS_ARRAY[:, 1:2],
+    )
+
+
+def _distance_kernel(q1: int, r1: int, q2: int, r2: int) -> int:
+    """distance() with branch-only abs, so Numba compiles it to plain integer ops."""
+    dq = q1 - q2
+    dr = r1 - r2
+    s = dq + dr
+    a = -dq if dq < 0 else dq
+    b = -dr if dr < 0 else dr
+    c = -s if s < 0 else s
+    return (a + b + c) // 2
+
+
+def _neighbors_kernel(q: int, r: int) -> np.ndarray:
+    """All 6 neighbors of (q, r) as a (6, 2) array indexed by edge."""
+    out = np.empty((6, 2), dtype=np.int64)
+    for edge in range(6):
+        out[edge, 0] = q + HEX_NEIGHBOR_OFFSETS_ARRAY[edge, 0]
+        out[edge, 1] = r + HEX_NEIGHBOR_OFFSETS_ARRAY[edge, 1]
+    return out
+
+
+# JIT-compiled kernels for worldgen inner loops (e.g. A* on hex grids).
+# Without numba these are the plain Python kernels, so callers can use
+# them unconditionally; non-hot-path callers should keep using distance().
+if HAS_NUMBA:
+    distance_jit = njit(cache=True)(_distance_kernel)
+    neighbors_jit = njit(cache=True)(_neighbors_kernel)
+else:
+    distance_jit = _distance_kernel
+    neighbors_jit = _neighbors_kernel
+
+
 def coords_to_key(q: int, r: int) -> str:
     """Convert coordinates to string key for dict lookups."""
     return f"{q},{r}"
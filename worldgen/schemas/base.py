@@ -4,7 +4,7 @@ from enum import Enum
 from typing import Optional
 import hashlib
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Terrain(str, Enum):
@@ -187,7 +187,12 @@ class Feature(BaseModel):
 
 
 class SpeciesFitness(BaseModel):
-    """How suitable a location is for each species."""
+    """How suitable a location is for each species.
+
+    Frozen, so one validated instance can be shared by many hexes.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     human: float = Field(ge=0.0, le=1.0)
     dwarf: float = Field(ge=0.0, le=1.0)
@@ -195,7 +200,13 @@ class SpeciesFitness(BaseModel):
 
 
 class HexCoord(BaseModel):
-    """Axial hex coordinates."""
+    """Axial hex coordinates.
+
+    Frozen, so the hash stays valid for coordinates used as set members
+    or dict keys. Serializes as ``{"q": ..., "r": ...}`` like any model.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     q: int
     r: int
@@ -210,10 +221,19 @@ class HexCoord(BaseModel):
 
     def distance_to(self, other: "HexCoord") -> int:
         """Calculate hex distance using axial coordinates."""
-        dq = abs(self.q - other.q)
-        dr = abs(self.r - other.r)
-        ds = abs((self.q + self.r) - (other.q + other.r))
-        return max(dq, dr, ds)
+        return _axial_distance(self.q, self.r, other.q, other.r)
+
+
+def _axial_distance(q1: int, r1: int, q2: int, r2: int) -> int:
+    """Hex distance between two axial coordinates, without branching.
+
+    Plain Python on purpose: for one call the numba dispatch overhead costs
+    more than the arithmetic. Compiled loops should use
+    ``hex_coords.distance_jit``, which computes the same value.
+    """
+    dq = q1 - q2
+    dr = r1 - r2
+    return (abs(dq) + abs(dr) + abs(dq + dr)) // 2
 
 
 def generate_stable_id(
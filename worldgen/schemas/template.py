@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from .base import Species
@@ -90,6 +91,15 @@ class AssembledCluster(BaseModel):
     port_positions: dict[str, tuple[int, int]] = Field(default_factory=dict)
     footprint: list[tuple[int, int]] = Field(default_factory=list)
 
+    @property
+    def footprint_array(self) -> np.ndarray:
+        """Footprint offsets as an (N, 2) int32 array.
+
+        Rebuilt on each access: not cached, so it never goes stale and never
+        lands in ``__dict__`` where it would break model equality.
+        """
+        return np.asarray(self.footprint, dtype=np.int32).reshape(-1, 2)
+
     def get_component_at(self, offset: tuple[int, int]) -> Optional[str]:
         """Get component ID at given offset, or None."""
         for comp_id, comp_offset in self.layout.items():
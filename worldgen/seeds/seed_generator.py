@@ -1,9 +1,8 @@
 """Generate valid world seeds."""
 
-import json
 import random
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
 from worldgen.schemas import (
     WorldSeed,
@@ -63,14 +62,27 @@ class SeedGenerator:
             world_radius=world_radius,
         )
 
-    def save_seed(self, seed: WorldSeed, output_path: Path) -> None:
-        """Save a seed to a JSON file."""
+    def generate_seeds_batch(self, seed_ids: list[int], **kwargs) -> list[WorldSeed]:
+        """Generate one seed per seed_id with shared options.
+
+        Each seed is identical to ``generate_seed(seed_id, **kwargs)``, so a
+        world can be regenerated from its seed_id alone.
+        """
+        return [self.generate_seed(seed_id, **kwargs) for seed_id in seed_ids]
+
+    def save_seed(self, seed: WorldSeed, output_path: str | Path | IO[str]) -> None:
+        """Save a seed as JSON to a file path or an open text stream."""
+        data = seed.model_dump_json(indent=2)
+        if hasattr(output_path, "write"):
+            output_path.write(data)
+            return
+        output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, "w") as f:
-            f.write(seed.model_dump_json(indent=2))
+            f.write(data)
 
-    def load_seed(self, seed_path: Path) -> WorldSeed:
-        """Load a seed from a JSON file."""
-        with open(seed_path) as f:
-            data = json.load(f)
-        return WorldSeed.model_validate(data)
+    def load_seed(self, seed_path: str | Path | IO[str]) -> WorldSeed:
+        """Load a seed from a JSON file path or an open text stream."""
+        if hasattr(seed_path, "read"):
+            return WorldSeed.model_validate_json(seed_path.read())
+        return WorldSeed.model_validate_json(Path(seed_path).read_bytes())
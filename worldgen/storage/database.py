@@ -3,7 +3,7 @@
 import json
 import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from worldgen.schemas import (
     Component,
@@ -20,18 +20,55 @@ class AssetDatabase:
 
     Stores Pydantic models as JSON in the data column.
     Uses raw sqlite3 (no ORM).
+
+    With ``fast_mode`` a file-backed database runs in WAL mode without
+    per-commit fsync, with a 64 MB page cache and memory-mapped reads, so
+    test datasets stay in RAM.
+    ``:memory:`` databases ignore it since WAL does not apply there.
+
+    With ``uri`` the path is an SQLite URI, e.g.
+    ``file:worldgen?mode=memory&cache=shared``: every connection opened on
+    that URI shares one in-memory database for as long as any of them
+    stays open.
     """
 
-    def __init__(self, db_path: Path):
+    FAST_MODE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=268435456",
+    )
+
+    # Compiled statements kept per connection; the filtered list_* queries
+    # vary by which filters are set, so leave room for every combination
+    STATEMENT_CACHE_SIZE = 256
+
+    def __init__(self, db_path: Path | str, fast_mode: bool = False, uri: bool = False):
         self.db_path = db_path
+        self.fast_mode = fast_mode
+        self.uri = uri
         self._conn: Optional[sqlite3.Connection] = None
 
+    @property
+    def is_memory(self) -> bool:
+        if self.uri:
+            return "mode=memory" in str(self.db_path)
+        return str(self.db_path) == ":memory:"
+
     @property
     def conn(self) -> sqlite3.Connection:
         if self._conn is None:
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._conn = sqlite3.connect(self.db_path)
+            if not (self.is_memory or self.uri):
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.db_path, cached_statements=self.STATEMENT_CACHE_SIZE, uri=self.uri
+            )
             self._conn.row_factory = sqlite3.Row
+            if self.fast_mode and not self.is_memory:
+                for pragma in self.FAST_MODE_PRAGMAS:
+                    self._conn.execute(pragma)
+            if self.is_memory:
+                self._conn.execute("PRAGMA temp_store=MEMORY")
         return self._conn
 
     def init(self) -> None:
@@ -67,6 +104,7 @@ class AssetDatabase:
 
             CREATE INDEX IF NOT EXISTS idx_comp_category ON components(category);
             CREATE INDEX IF NOT EXISTS idx_comp_species ON components(species);
+            CREATE INDEX IF NOT EXISTS idx_comp_quality ON components(quality_score);
             CREATE INDEX IF NOT EXISTS idx_conn_type ON connectors(type);
             CREATE INDEX IF NOT EXISTS idx_minor_category ON minors(category);
         """)
@@ -83,21 +121,31 @@ class AssetDatabase:
     # Component methods
     # =========================================================================
 
+    _SAVE_COMPONENT_SQL = """
+        INSERT OR REPLACE INTO components (id, category, species, tags, data, quality_score)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _component_row(component: Component) -> tuple:
+        return (
+            component.id,
+            component.category.value,
+            component.species.value,
+            json.dumps(component.tags),
+            component.model_dump_json(),
+            component.quality_score,
+        )
+
     def save_component(self, component: Component) -> None:
         """Save a component to the database (insert or replace)."""
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO components (id, category, species, tags, data, quality_score)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                component.id,
-                component.category.value,
-                component.species.value,
-                json.dumps(component.tags),
-                component.model_dump_json(),
-                component.quality_score,
-            ),
+        self.conn.execute(self._SAVE_COMPONENT_SQL, self._component_row(component))
+        self.conn.commit()
+
+    def save_components(self, components: Iterable[Component]) -> None:
+        """Save many components in a single transaction (insert or replace)."""
+        self.conn.executemany(
+            self._SAVE_COMPONENT_SQL, map(self._component_row, components)
         )
         self.conn.commit()
 
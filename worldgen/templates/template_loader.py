@@ -10,7 +10,15 @@ from worldgen.schemas import ClusterTemplate
 
 
 class TemplateLoader:
-    """Load cluster templates from YAML files."""
+    """Load cluster templates from YAML files.
+
+    ``load_all`` results are cached per templates directory and reused until
+    a YAML file is added, removed or modified. Each call returns deep copies,
+    so callers may mutate their templates without affecting the cache.
+    """
+
+    # templates_dir -> (file signature, templates)
+    _cache: dict[Path, tuple[tuple, dict[str, ClusterTemplate]]] = {}
 
     def __init__(self, templates_dir: Optional[Path] = None):
         self.templates_dir = templates_dir or config.TEMPLATES_DIR
@@ -28,9 +36,21 @@ class TemplateLoader:
 
     def load_all(self) -> dict[str, ClusterTemplate]:
         """Load all templates from the templates directory."""
+        yaml_files = sorted(self.templates_dir.rglob("*.yaml"))
+        # Size as well as mtime, since an edit within one coarse mtime tick
+        # leaves st_mtime_ns unchanged
+        stats = [p.stat() for p in yaml_files]
+        signature = tuple(
+            (str(p), st.st_mtime_ns, st.st_size) for p, st in zip(yaml_files, stats)
+        )
+
+        cached = self._cache.get(self.templates_dir)
+        if cached is not None and cached[0] == signature:
+            return self._copy(cached[1])
+
         templates = {}
 
-        for yaml_file in self.templates_dir.rglob("*.yaml"):
+        for yaml_file in yaml_files:
             try:
                 with open(yaml_file) as f:
                     data = yaml.safe_load(f)
@@ -40,7 +60,13 @@ class TemplateLoader:
             except Exception as e:
                 print(f"Failed to load {yaml_file}: {e}")
 
-        return templates
+        self._cache[self.templates_dir] = (signature, templates)
+        return self._copy(templates)
+
+    @staticmethod
+    def _copy(templates: dict[str, ClusterTemplate]) -> dict[str, ClusterTemplate]:
+        """Deep-copy cached templates so callers never share them."""
+        return {tid: t.model_copy(deep=True) for tid, t in templates.items()}
 
     def validate_template(
         self, template: ClusterTemplate, component_categories: set[str]
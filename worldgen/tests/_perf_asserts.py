@@ -0,0 +1,16 @@
+"""Assertion helpers that guard performance properties without timing."""
+
+import sqlite3
+
+
+def assert_uses_index(
+    conn: sqlite3.Connection, sql: str, params: tuple | list, idx: str
+) -> None:
+    """Assert that SQLite plans ``sql`` using the index named ``idx``.
+
+    Runs ``EXPLAIN QUERY PLAN`` and checks the detail column of each plan
+    row, so a filter that silently falls back to a table scan fails the test.
+    """
+    rows = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+    details = [r[-1] for r in rows]
+    assert any(idx in d for d in details), f"{idx} not used by plan: {details}"
@@ -0,0 +1,32 @@
+"""Shared fixtures for worldgen tests."""
+
+from pathlib import Path
+
+import pytest
+
+from worldgen.storage import Database
+from worldgen.templates import TemplateLoader
+
+
+@pytest.fixture(scope="session")
+def templates():
+    """All templates, loaded from disk once per session."""
+    return TemplateLoader().load_all()
+
+
+@pytest.fixture(scope="session")
+def schema_db():
+    """An initialized, empty in-memory database built once per session."""
+    database = Database(Path(":memory:"))
+    database.init()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def db(schema_db):
+    """A fresh in-memory database per test, copied from the schema database."""
+    database = Database(Path(":memory:"))
+    schema_db.conn.backup(database.conn)
+    yield database
+    database.close()
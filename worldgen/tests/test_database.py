@@ -1,6 +1,6 @@
 """Tests for SQLite storage."""
 
-import tempfile
+import atexit
 from pathlib import Path
 
 import pytest
@@ -17,17 +17,52 @@ from worldgen.schemas import (
     MinorAnchor,
     MinorCategory,
 )
+from worldgen.tests._perf_asserts import assert_uses_index
+
+
+# One open connection per database path, shared by every test in the module
+_CONN_POOL: dict[str, AssetDatabase] = {}
+
+
+def _close_pool() -> None:
+    for db in _CONN_POOL.values():
+        db.close()
+
+
+atexit.register(_close_pool)
+
+
+def _pooled_db(path: str = ":memory:") -> AssetDatabase:
+    """Get the pooled database for a path, creating its schema on first use."""
+    db = _CONN_POOL.get(path)
+    if db is None:
+        db = AssetDatabase(Path(path))
+        db.init()
+        _CONN_POOL[path] = db
+    return db
+
+
+def _executed_select(db: AssetDatabase, call) -> str:
+    """Run ``call()`` and return the SELECT it executed, parameters bound."""
+    statements: list[str] = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        db.conn.set_trace_callback(None)
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1, statements
+    return selects[0]
 
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        db = AssetDatabase(db_path)
-        db.init()
-        yield db
-        db.close()
+    """Provide the pooled in-memory database, emptied after each test."""
+    db = _pooled_db()
+    yield db
+    for table in ("components", "connectors", "minors"):
+        db.conn.execute(f"DELETE FROM {table}")
+    db.conn.commit()
 
 
 class TestDatabaseInit:
@@ -38,6 +73,43 @@ class TestDatabaseInit:
         assert "connectors" in tables
         assert "minors" in tables
 
+    def test_fast_mode_uses_wal(self, tmp_path):
+        """File-backed fast mode switches the journal to WAL."""
+        db = AssetDatabase(tmp_path / "test.db", fast_mode=True)
+        db.init()
+        mode = db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        db.close()
+
+    def test_fast_mode_ignored_for_memory(self):
+        """In-memory databases keep their default journal in fast mode."""
+        db = AssetDatabase(Path(":memory:"), fast_mode=True)
+        db.init()
+        mode = db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "memory"
+        db.close()
+
+    def test_shared_memory_uri(self):
+        """Connections on one shared-cache URI see the same in-memory data."""
+        uri = "file:worldgen_shared_test?mode=memory&cache=shared"
+        writer = AssetDatabase(uri, uri=True)
+        reader = AssetDatabase(uri, uri=True)
+        assert writer.is_memory
+
+        writer.init()
+        writer.save_connector(
+            ConnectorCollection(
+                id="shared_conn",
+                type=ConnectorType.TRADE_ROUTE_MAJOR,
+                tags=["trade"],
+                quality_score=7.0,
+            )
+        )
+
+        assert reader.get_connector("shared_conn") is not None
+        reader.close()
+        writer.close()
+
 
 class TestComponentOperations:
     def test_save_and_get_component(self, temp_db):
@@ -115,6 +187,11 @@ class TestComponentOperations:
         results = temp_db.list_components(category=ComponentCategory.DWARF_HOLD_ENTRANCE)
         assert len(results) == 1
 
+        sql = _executed_select(
+            temp_db, lambda: temp_db.list_components(category=ComponentCategory.DWARF_HOLD_FORGE)
+        )
+        assert_uses_index(temp_db.conn, sql, (), "idx_comp_category")
+
     def test_list_components_by_min_quality(self, temp_db):
         """Test listing components filtered by minimum quality."""
         # Insert components with different quality scores
@@ -138,6 +215,9 @@ class TestComponentOperations:
         results = temp_db.list_components(min_quality=8.0)
         assert len(results) == 2  # Should get the 8.0 and 9.0 scored ones
 
+        sql = _executed_select(temp_db, lambda: temp_db.list_components(min_quality=8.0))
+        assert_uses_index(temp_db.conn, sql, (), "idx_comp_quality")
+
     def test_delete_component(self, temp_db):
         """Test deleting a component."""
         comp = Component(
@@ -205,6 +285,29 @@ class TestComponentOperations:
         assert retrieved.quality_score == 9.0
         assert "updated" in retrieved.tags
 
+    def test_save_components_bulk(self, temp_db):
+        """Bulk save stores every component."""
+        temp_db.save_components(
+            Component(
+                id=f"bulk_{i}",
+                category=ComponentCategory.DWARF_HOLD_FORGE,
+                tags=["dwarf"],
+                species=Species.DWARF,
+                terrain=Terrain.UNDERGROUND,
+                elevation=500.0,
+                moisture=0.2,
+                temperature=25.0,
+                species_fitness=SpeciesFitness(human=0.3, dwarf=0.9, elf=0.1),
+                name_fragment=f"Bulk Forge {i}",
+                narrative_hook="Bulk hook.",
+                quality_score=7.0 + i,
+            )
+            for i in range(3)
+        )
+
+        assert temp_db.get_stats()["components"] == 3
+        assert temp_db.get_component("bulk_2").quality_score == 9.0
+
 
 class TestConnectorOperations:
     def test_save_and_get_connector(self, temp_db):
@@ -253,6 +356,11 @@ class TestConnectorOperations:
         results = temp_db.list_connectors(connector_type=ConnectorType.RIVER_FULL)
         assert len(results) == 2
 
+        sql = _executed_select(
+            temp_db, lambda: temp_db.list_connectors(connector_type=ConnectorType.RIVER_FULL)
+        )
+        assert_uses_index(temp_db.conn, sql, (), "idx_conn_type")
+
     def test_delete_connector(self, temp_db):
         """Test deleting a connector."""
         connector = ConnectorCollection(
@@ -320,6 +428,9 @@ class TestMinorOperations:
         results = temp_db.list_minors(category=MinorCategory.INN)
         assert len(results) == 2
 
+        sql = _executed_select(temp_db, lambda: temp_db.list_minors(category=MinorCategory.INN))
+        assert_uses_index(temp_db.conn, sql, (), "idx_minor_category")
+
     def test_delete_minor(self, temp_db):
         """Test deleting a minor anchor."""
         minor = MinorAnchor(
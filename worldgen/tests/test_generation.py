@@ -1,15 +1,38 @@
 """Tests for LLM client and quality loop generation."""
 
+import asyncio
+import gc
+import itertools
 import json
-from unittest.mock import MagicMock, patch
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from openai import RateLimitError
 
 from worldgen.generation.llm_client import DeepSeekClient
 from worldgen.generation.quality_loop import QualityGenerator, ScoringResult
 from worldgen.schemas import ComponentCategory
 
 
+@pytest.fixture(scope="module")
+def mock_openai():
+    """Patch the OpenAI class once for the whole module."""
+    with patch("worldgen.generation.llm_client.OpenAI") as m:
+        yield m
+
+
+@pytest.fixture
+def mock_client(mock_openai):
+    """Fresh mock OpenAI instance returned by the patched class."""
+    mock_openai.reset_mock(return_value=True, side_effect=True)
+    client = MagicMock()
+    mock_openai.return_value = client
+    return client
+
+
 class TestDeepSeekClient:
     """Tests for DeepSeekClient."""
 
@@ -27,76 +50,242 @@ class TestDeepSeekClient:
             finally:
                 config_module.DEEPSEEK_API_KEY = original_key
 
-    def test_init_with_explicit_api_key(self):
+    def test_init_with_explicit_api_key(self, mock_openai, mock_client):
         """Client should accept explicit API key."""
-        with patch("worldgen.generation.llm_client.OpenAI") as mock_openai:
-            client = DeepSeekClient(api_key="test-key")
-            assert client.api_key == "test-key"
-            mock_openai.assert_called_once_with(
-                api_key="test-key",
-                base_url="https://api.deepseek.com",
-            )
+        client = DeepSeekClient(api_key="test-key")
+        assert client.api_key == "test-key"
+        mock_openai.assert_called_once_with(
+            api_key="test-key",
+            base_url="https://api.deepseek.com",
+            max_retries=0,
+        )
+
+    def test_init_passes_shared_http_client(self, mock_openai, mock_client):
+        """An explicit http_client should be handed to the OpenAI client."""
+        http_client = MagicMock(spec=httpx.Client)
+        DeepSeekClient(api_key="test-key", http_client=http_client)
+        assert mock_openai.call_args.kwargs["http_client"] is http_client
 
-    def test_generate_calls_openai_api(self):
+    def test_generate_calls_openai_api(self, mock_client):
         """Generate should call the OpenAI-compatible API."""
-        with patch("worldgen.generation.llm_client.OpenAI") as mock_openai:
-            mock_client = MagicMock()
-            mock_openai.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="test output"))]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        client = DeepSeekClient(api_key="test-key")
+        result = client.generate("test prompt")
+
+        assert result == "test output"
+        mock_client.chat.completions.create.assert_called_once()
+
+    def test_generate_json_parses_response(self, mock_client):
+        """Generate JSON should parse valid JSON response."""
+        mock_response = MagicMock()
+        mock_response.choices = [
+            MagicMock(message=MagicMock(content='{"key": "value"}'))
+        ]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        client = DeepSeekClient(api_key="test-key")
+        result = client.generate_json("test prompt")
+
+        assert result == {"key": "value"}
+
+    def test_generate_retries_on_rate_limit(self, mock_client):
+        """Generate should back off and retry when rate limited."""
+        rate_limited = RateLimitError(
+            "rate limited",
+            response=httpx.Response(
+                429, request=httpx.Request("POST", "https://api.deepseek.com")
+            ),
+            body=None,
+        )
+        with patch("worldgen.config.LLM_RETRY_MIN_WAIT", 0), patch(
+            "worldgen.config.LLM_RETRY_MAX_WAIT", 0
+        ):
             mock_response = MagicMock()
             mock_response.choices = [MagicMock(message=MagicMock(content="test output"))]
-            mock_client.chat.completions.create.return_value = mock_response
+            mock_client.chat.completions.create.side_effect = [
+                rate_limited,
+                rate_limited,
+                mock_response,
+            ]
 
             client = DeepSeekClient(api_key="test-key")
             result = client.generate("test prompt")
 
             assert result == "test output"
-            mock_client.chat.completions.create.assert_called_once()
+            assert mock_client.chat.completions.create.call_count == 3
+
+    def test_generate_stream_stops_at_closing_brace(self, mock_client):
+        """Streaming should parse once the top-level JSON object closes."""
+        pieces = ['```json\n{"name": "Fo', 'rge {', 'A}", "tags": ["a"]}', "\n```", "unread"]
+        chunks = [
+            MagicMock(choices=[MagicMock(delta=MagicMock(content=p))])
+            for p in pieces
+        ]
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(chunks)
+        mock_client.chat.completions.create.return_value = stream
 
-    def test_generate_json_parses_response(self):
-        """Generate JSON should parse valid JSON response."""
-        with patch("worldgen.generation.llm_client.OpenAI") as mock_openai:
-            mock_client = MagicMock()
-            mock_openai.return_value = mock_client
-            mock_response = MagicMock()
-            mock_response.choices = [
-                MagicMock(message=MagicMock(content='{"key": "value"}'))
-            ]
-            mock_client.chat.completions.create.return_value = mock_response
+        client = DeepSeekClient(api_key="test-key")
+        result = client.generate_stream("test prompt")
+
+        assert result == {"name": "Forge {A}", "tags": ["a"]}
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+        stream.close.assert_called_once()
+
+    def test_generate_uses_cache_for_repeat_prompts(self, mock_client, tmp_path):
+        """Identical requests should hit the API only once when caching."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="test output"))]
+        mock_client.chat.completions.create.return_value = mock_response
 
+        client = DeepSeekClient(
+            api_key="test-key", cache=True, cache_path=tmp_path / "cache.db"
+        )
+        first = client.generate("test prompt")
+        second = client.generate("test prompt")
+
+        assert first == second == "test output"
+        mock_client.chat.completions.create.assert_called_once()
+
+        client.generate("test prompt", bypass_cache=True)
+        assert mock_client.chat.completions.create.call_count == 2
+
+    def test_cache_is_usable_from_other_threads(self, mock_client, tmp_path):
+        """The cache connection is not tied to the thread that opened it."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="test output"))]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        client = DeepSeekClient(
+            api_key="test-key", cache=True, cache_path=tmp_path / "cache.db"
+        )
+        client.generate("test prompt")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(client.generate, ["test prompt"] * 8))
+
+        assert results == ["test output"] * 8
+        mock_client.chat.completions.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_agenerate_json_uses_async_client(self, mock_openai):
+        """Async generate JSON should go through the AsyncOpenAI client."""
+        mock_response = MagicMock()
+        mock_response.choices = [
+            MagicMock(message=MagicMock(content='{"key": "value"}'))
+        ]
+        mock_async_client = AsyncMock(
+            chat=MagicMock(completions=MagicMock(create=AsyncMock(return_value=mock_response)))
+        )
+        with patch(
+            "worldgen.generation.llm_client.AsyncOpenAI", return_value=mock_async_client
+        ) as mock_async_cls:
+            client = DeepSeekClient(api_key="test-key")
+            result = await client.agenerate_json("test prompt")
+
+        assert result == {"key": "value"}
+        mock_async_client.chat.completions.create.assert_awaited_once()
+        # SDK retries are off; tenacity owns retrying
+        assert mock_async_cls.call_args.kwargs["max_retries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_owned_pool_only(self, mock_openai):
+        """aclose() closes the client's own async pool, never a caller-owned one."""
+        with patch("worldgen.generation.llm_client.AsyncOpenAI") as mock_async_cls:
+            mock_async_cls.return_value.close = AsyncMock()
+            owned = DeepSeekClient(api_key="test-key")
+            owned.async_client
+            await owned.aclose()
+            mock_async_cls.return_value.close.assert_awaited_once()
+
+            mock_async_cls.reset_mock()
+            mock_async_cls.return_value.close = AsyncMock()
+            pool = MagicMock(spec=httpx.AsyncClient)
+            shared = DeepSeekClient(api_key="test-key", async_http_client=pool)
+            shared.async_client
+            assert mock_async_cls.call_args.kwargs["http_client"] is pool
+            await shared.aclose()
+            mock_async_cls.return_value.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_agenerate_json_batch_parses_candidates(self, mock_openai):
+        """Async batched generation should parse one candidates response."""
+        mock_response = MagicMock()
+        mock_response.choices = [
+            MagicMock(message=MagicMock(content=json.dumps(
+                {"candidates": [{"name": "A"}, {"name": "B"}]}
+            )))
+        ]
+        mock_async_client = AsyncMock(
+            chat=MagicMock(completions=MagicMock(create=AsyncMock(side_effect=[mock_response])))
+        )
+        with patch(
+            "worldgen.generation.llm_client.AsyncOpenAI", return_value=mock_async_client
+        ):
             client = DeepSeekClient(api_key="test-key")
-            result = client.generate_json("test prompt")
+            result = await client.agenerate_json_batch("test prompt", 2)
+
+        assert result == [{"name": "A"}, {"name": "B"}]
+        mock_async_client.chat.completions.create.assert_awaited_once()
+
+    def test_generate_json_batch_parses_candidates(self, mock_client):
+        """Batched generation should return the candidates from one response."""
+        mock_response = MagicMock()
+        mock_response.choices = [
+            MagicMock(message=MagicMock(content=json.dumps(
+                {"candidates": [{"name": "A"}, {"name": "B"}, {"name": "C"}]}
+            )))
+        ]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        client = DeepSeekClient(api_key="test-key")
+        result = client.generate_json_batch("test prompt", 3)
 
-            assert result == {"key": "value"}
+        assert result == [{"name": "A"}, {"name": "B"}, {"name": "C"}]
+        mock_client.chat.completions.create.assert_called_once()
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs["response_format"] == {"type": "json_object"}
 
-    def test_clean_and_parse_json_handles_markdown(self):
+    def test_clean_and_parse_json_handles_markdown(self, mock_openai):
         """Should strip markdown code blocks from JSON."""
-        with patch("worldgen.generation.llm_client.OpenAI") as mock_openai:
-            mock_openai.return_value = MagicMock()
-            client = DeepSeekClient(api_key="test-key")
+        client = DeepSeekClient(api_key="test-key")
 
-            # Test with markdown code blocks
-            content = '```json\n{"key": "value"}\n```'
-            result = client._clean_and_parse_json(content)
-            assert result == {"key": "value"}
+        # Test with markdown code blocks
+        content = '```json\n{"key": "value"}\n```'
+        result = client._clean_and_parse_json(content)
+        assert result == {"key": "value"}
 
-            # Test with just ``` without json
-            content = '```\n{"key": "value2"}\n```'
-            result = client._clean_and_parse_json(content)
-            assert result == {"key": "value2"}
+        # Test with just ``` without json
+        content = '```\n{"key": "value2"}\n```'
+        result = client._clean_and_parse_json(content)
+        assert result == {"key": "value2"}
 
-    def test_clean_and_parse_json_handles_json_prefix(self):
+    def test_clean_and_parse_json_handles_json_prefix(self, mock_openai):
         """Should handle 'json' prefix in content."""
-        with patch("worldgen.generation.llm_client.OpenAI") as mock_openai:
-            mock_openai.return_value = MagicMock()
-            client = DeepSeekClient(api_key="test-key")
-
-            content = 'json{"key": "value"}'
-            result = client._clean_and_parse_json(content)
-            assert result == {"key": "value"}
+        client = DeepSeekClient(api_key="test-key")
+
+        content = 'json{"key": "value"}'
+        result = client._clean_and_parse_json(content)
+        assert result == {"key": "value"}
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '```javascript\n{"key": "value"}\n```',
+            '```jsonc\n{"key": "value"}\n```',
+            '```\njson\n{"key": "value"}\n```',
+        ],
+    )
+    def test_clean_and_parse_json_drops_whole_fence_line(self, mock_openai, content):
+        """Any opening fence tag is dropped, plus a 'json' line after a bare fence."""
+        client = DeepSeekClient(api_key="test-key")
+        assert client._clean_and_parse_json(content) == {"key": "value"}
 
 
 class TestScoringResult:
-    """Tests for ScoringResult dataclass."""
+    """Tests for ScoringResult."""
 
     def test_from_dict(self):
         """Should create ScoringResult from dictionary."""
@@ -143,6 +332,77 @@ class TestQualityGenerator:
         assert generator.candidates_per_round == 3  # CANDIDATES_PER_ROUND
         assert generator.client is None  # Lazy initialization
 
+    def test_get_client_creates_one_client_across_threads(self):
+        """Concurrent first use should construct a single client."""
+        generator = QualityGenerator()
+        with patch("worldgen.generation.quality_loop.DeepSeekClient") as mock_cls:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                clients = list(pool.map(lambda _: generator._get_client(), range(32)))
+
+        mock_cls.assert_called_once_with(async_http_client=None)
+        assert all(c is mock_cls.return_value for c in clients)
+
+    def test_sync_calls_share_one_event_loop(self):
+        """generate_with_quality reuses one loop, so the async pool survives."""
+        mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
+        generator = QualityGenerator(client=mock_client)
+        loops = []
+
+        async def fake_agenerate(*args):
+            loops.append(asyncio.get_running_loop())
+            return None, None
+
+        with patch.object(generator, "agenerate_with_quality", side_effect=fake_agenerate):
+            with generator:
+                generator.generate_with_quality("prompt", "asset", "dwarf")
+                generator.generate_with_quality("prompt", "asset", "dwarf")
+
+        assert loops[0] is loops[1]
+        assert loops[0].is_closed()
+        mock_client.aclose.assert_awaited_once()
+
+    def test_unclosed_generator_stops_its_loop_when_collected(self):
+        """Dropping a generator without close() still stops its loop thread."""
+        generator = QualityGenerator(client=MagicMock())
+        generator._run(asyncio.sleep(0))
+        loop = generator._loop
+
+        del generator
+        gc.collect()
+
+        assert loop.is_closed()
+        assert not any(t.name == "quality-loop" for t in threading.enumerate())
+
+    def test_generate_with_quality_with_cache_enabled(self, mock_openai, tmp_path):
+        """The loop thread can read and write a cache opened on this thread."""
+        responses = [
+            {"candidates": [{"name": "Cached Forge"}]},
+            {"scores": [{"overall_score": 9.0}]},
+        ]
+        mock_async_client = AsyncMock(chat=MagicMock(completions=MagicMock(create=AsyncMock(
+            side_effect=[
+                MagicMock(choices=[MagicMock(message=MagicMock(content=json.dumps(r)))])
+                for r in responses
+            ]
+        ))))
+        with patch(
+            "worldgen.generation.llm_client.AsyncOpenAI", return_value=mock_async_client
+        ):
+            client = DeepSeekClient(
+                api_key="test-key", cache=True, cache_path=tmp_path / "cache.db"
+            )
+            with QualityGenerator(
+                target_score=9.0, candidates_per_round=1, client=client
+            ) as generator:
+                result, score = generator.generate_with_quality(
+                    "Generate a forge", "dwarf forge", "dwarf"
+                )
+
+        assert result == {"name": "Cached Forge"}
+        assert score.overall_score == 9.0
+        assert client._cache.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 2
+
     def test_init_custom_values(self):
         """Should accept custom configuration."""
         mock_client = MagicMock()
@@ -180,13 +440,28 @@ class TestQualityGenerator:
         assert result.strengths == ["good"]
         mock_client.generate_json.assert_called_once()
 
+    def test_score_asset_caches_identical_assets(self):
+        """Re-scoring an identical asset should not call the LLM again."""
+        mock_client = MagicMock()
+        mock_client.generate_json.return_value = {"overall_score": 7}
+
+        generator = QualityGenerator(client=mock_client)
+        first = generator.score_asset({"name": "Forge", "size": 2}, "dwarf forge", "dwarf")
+        second = generator.score_asset({"size": 2, "name": "Forge"}, "dwarf forge", "dwarf")
+
+        assert second is first
+        mock_client.generate_json.assert_called_once()
+
     def test_generate_with_quality_reaches_target(self):
         """Should return when target score is reached."""
         mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
         # First generation returns high score
-        mock_client.generate_json.side_effect = [
-            {"name": "Good Forge", "desc": "A great forge"},  # Candidate
-            {  # Score
+        mock_client.agenerate_json_batch = AsyncMock(side_effect=[
+            [{"name": "Good Forge", "desc": "A great forge"}],  # Candidates
+        ])
+        mock_client.agenerate_json = AsyncMock(side_effect=[
+            {"scores": [{  # Score
                 "strategic_score": 9,
                 "narrative_score": 9,
                 "authenticity_score": 9,
@@ -195,8 +470,8 @@ class TestQualityGenerator:
                 "strengths": ["excellent"],
                 "weaknesses": [],
                 "improvement_suggestions": [],
-            },
-        ]
+            }]},
+        ])
 
         generator = QualityGenerator(
             target_score=9.0,
@@ -205,11 +480,12 @@ class TestQualityGenerator:
             client=mock_client,
         )
 
-        result, score = generator.generate_with_quality(
-            prompt_template="Generate a forge",
-            asset_type="dwarf forge",
-            species="dwarf",
-        )
+        with generator:
+            result, score = generator.generate_with_quality(
+                prompt_template="Generate a forge",
+                asset_type="dwarf forge",
+                species="dwarf",
+            )
 
         assert result is not None
         assert result["name"] == "Good Forge"
@@ -222,11 +498,15 @@ class TestQualityGenerator:
     def test_generate_with_quality_iterates_on_low_score(self):
         """Should iterate when score is below target."""
         mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
         # First round: low score, second round: high score
-        mock_client.generate_json.side_effect = [
+        mock_client.agenerate_json_batch = AsyncMock(side_effect=[
+            [{"name": "Basic Forge"}],  # Round 1
+            [{"name": "Amazing Forge"}],  # Round 2 (improved)
+        ])
+        mock_client.agenerate_json = AsyncMock(side_effect=[
             # Round 1 - low score
-            {"name": "Basic Forge"},  # Candidate 1
-            {
+            {"scores": [{
                 "strategic_score": 5,
                 "narrative_score": 5,
                 "authenticity_score": 5,
@@ -235,10 +515,9 @@ class TestQualityGenerator:
                 "strengths": ["ok"],
                 "weaknesses": ["generic"],
                 "improvement_suggestions": ["add detail"],
-            },
+            }]},
             # Round 2 - high score after improvement prompt
-            {"name": "Amazing Forge"},  # Candidate 1 (improved)
-            {
+            {"scores": [{
                 "strategic_score": 9,
                 "narrative_score": 9,
                 "authenticity_score": 9,
@@ -247,8 +526,8 @@ class TestQualityGenerator:
                 "strengths": ["excellent"],
                 "weaknesses": [],
                 "improvement_suggestions": [],
-            },
-        ]
+            }]},
+        ])
 
         generator = QualityGenerator(
             target_score=9.0,
@@ -257,11 +536,12 @@ class TestQualityGenerator:
             client=mock_client,
         )
 
-        result, score = generator.generate_with_quality(
-            prompt_template="Generate a forge",
-            asset_type="dwarf forge",
-            species="dwarf",
-        )
+        with generator:
+            result, score = generator.generate_with_quality(
+                prompt_template="Generate a forge",
+                asset_type="dwarf forge",
+                species="dwarf",
+            )
 
         assert result is not None
         assert result["name"] == "Amazing Forge"
@@ -272,18 +552,22 @@ class TestQualityGenerator:
     def test_generate_with_quality_picks_best_candidate(self):
         """Should pick the best candidate from multiple per round."""
         mock_client = MagicMock()
-        mock_client.generate_json.side_effect = [
-            # 3 candidates in round 1
-            {"name": "Forge A"},
-            {"overall_score": 5.0, "strengths": [], "weaknesses": [], "improvement_suggestions": [],
-             "strategic_score": 5, "narrative_score": 5, "authenticity_score": 5, "sensory_score": 5},
-            {"name": "Forge B"},
-            {"overall_score": 9.5, "strengths": ["best"], "weaknesses": [], "improvement_suggestions": [],
-             "strategic_score": 9, "narrative_score": 9, "authenticity_score": 9, "sensory_score": 9},
-            {"name": "Forge C"},
-            {"overall_score": 7.0, "strengths": [], "weaknesses": [], "improvement_suggestions": [],
-             "strategic_score": 7, "narrative_score": 7, "authenticity_score": 7, "sensory_score": 7},
-        ]
+        mock_client.aclose = AsyncMock()
+        # 3 candidates in round 1, from one batched request
+        mock_client.agenerate_json_batch = AsyncMock(side_effect=[
+            [{"name": "Forge A"}, {"name": "Forge B"}, {"name": "Forge C"}],
+        ])
+        # Their 3 scores, in candidate order, from one batched request
+        mock_client.agenerate_json = AsyncMock(side_effect=[
+            {"scores": [
+                {"overall_score": 5.0, "strengths": [], "weaknesses": [], "improvement_suggestions": [],
+                 "strategic_score": 5, "narrative_score": 5, "authenticity_score": 5, "sensory_score": 5},
+                {"overall_score": 9.5, "strengths": ["best"], "weaknesses": [], "improvement_suggestions": [],
+                 "strategic_score": 9, "narrative_score": 9, "authenticity_score": 9, "sensory_score": 9},
+                {"overall_score": 7.0, "strengths": [], "weaknesses": [], "improvement_suggestions": [],
+                 "strategic_score": 7, "narrative_score": 7, "authenticity_score": 7, "sensory_score": 7},
+            ]},
+        ])
 
         generator = QualityGenerator(
             target_score=9.0,
@@ -292,24 +576,95 @@ class TestQualityGenerator:
             client=mock_client,
         )
 
-        result, score = generator.generate_with_quality(
-            prompt_template="Generate a forge",
-            asset_type="dwarf forge",
-            species="dwarf",
-        )
+        with generator:
+            result, score = generator.generate_with_quality(
+                prompt_template="Generate a forge",
+                asset_type="dwarf forge",
+                species="dwarf",
+            )
 
         assert result is not None
         assert result["name"] == "Forge B"  # The best one
         assert score is not None
         assert score.overall_score == 9.5
+        mock_client.agenerate_json_batch.assert_awaited_once()
+        mock_client.agenerate_json.assert_awaited_once()
+
+    def test_unscored_candidates_stop_at_first_target_score(self):
+        """Fallback scoring should cancel the rest once one reaches target."""
+        completed = []
+
+        async def judge(prompt, **kwargs):
+            if "ASSETS:" in prompt:
+                return {"scores": []}  # Batched judge returned nothing usable
+            if "Forge A" in prompt:
+                completed.append("Forge A")
+                return {"overall_score": 10.0, "strengths": ["best"]}
+            await asyncio.sleep(5)
+            completed.append("slow")
+            return {"overall_score": 5.0}
+
+        mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
+        mock_client.agenerate_json_batch = AsyncMock(side_effect=[
+            [{"name": "Forge A"}, {"name": "Forge B"}, {"name": "Forge C"}],
+        ])
+        mock_client.agenerate_json = AsyncMock(side_effect=judge)
+
+        generator = QualityGenerator(
+            target_score=9.0,
+            max_iterations=5,
+            candidates_per_round=3,
+            client=mock_client,
+        )
+
+        with generator:
+            result, score = generator.generate_with_quality(
+                prompt_template="Generate a forge",
+                asset_type="dwarf forge",
+                species="dwarf",
+            )
+
+        assert result == {"name": "Forge A"}
+        assert score.overall_score == 10.0
+        assert completed == ["Forge A"]
+
+    @pytest.mark.asyncio
+    async def test_agenerate_with_quality_reaches_target(self):
+        """The async quality loop should run inside an existing event loop."""
+        mock_client = MagicMock()
+        mock_client.agenerate_json_batch = AsyncMock(side_effect=[
+            [{"name": "Good Forge"}],
+        ])
+        mock_client.agenerate_json = AsyncMock(side_effect=[
+            {"scores": [{"overall_score": 9.0, "strengths": ["excellent"]}]},
+        ])
+
+        generator = QualityGenerator(
+            target_score=9.0,
+            candidates_per_round=1,
+            client=mock_client,
+        )
+
+        result, score = await generator.agenerate_with_quality(
+            prompt_template="Generate a forge",
+            asset_type="dwarf forge",
+            species="dwarf",
+        )
+
+        assert result == {"name": "Good Forge"}
+        assert score.overall_score == 9.0
 
     def test_generate_with_quality_returns_best_after_max_iterations(self):
         """Should return best result after exhausting iterations."""
         mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
         # Always return score below target
-        mock_client.generate_json.side_effect = [
-            {"name": "OK Forge"},
-            {
+        mock_client.agenerate_json_batch = AsyncMock(
+            side_effect=itertools.cycle([[{"name": "OK Forge"}]])  # Every iteration
+        )
+        mock_client.agenerate_json = AsyncMock(side_effect=itertools.cycle([
+            {"scores": [{
                 "strategic_score": 7,
                 "narrative_score": 7,
                 "authenticity_score": 7,
@@ -318,8 +673,8 @@ class TestQualityGenerator:
                 "strengths": ["decent"],
                 "weaknesses": ["not great"],
                 "improvement_suggestions": ["improve"],
-            },
-        ] * 10  # Repeat for all iterations
+            }]},
+        ]))
 
         generator = QualityGenerator(
             target_score=9.0,
@@ -328,23 +683,60 @@ class TestQualityGenerator:
             client=mock_client,
         )
 
-        result, score = generator.generate_with_quality(
-            prompt_template="Generate a forge",
-            asset_type="dwarf forge",
-            species="dwarf",
-        )
+        with generator:
+            result, score = generator.generate_with_quality(
+                prompt_template="Generate a forge",
+                asset_type="dwarf forge",
+                species="dwarf",
+            )
 
         assert result is not None
         assert score is not None
         assert score.overall_score == 7.0  # Best we got
         assert generator.stats.total_iterations == 2
 
+    def test_generate_with_quality_stops_without_feedback_near_target(self):
+        """Should not run another round when the judge gives nothing to fix."""
+        mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
+        mock_client.agenerate_json_batch = AsyncMock(
+            side_effect=itertools.cycle([[{"name": "Fine Forge"}]])
+        )
+        mock_client.agenerate_json = AsyncMock(return_value={"scores": [{
+            "overall_score": 8.6,
+            "strengths": ["solid"],
+            "weaknesses": [],
+            "improvement_suggestions": [],
+        }]})
+
+        generator = QualityGenerator(
+            target_score=9.0,
+            max_iterations=5,
+            candidates_per_round=1,
+            client=mock_client,
+        )
+
+        with generator:
+            result, score = generator.generate_with_quality(
+                prompt_template="Generate a forge",
+                asset_type="dwarf forge",
+                species="dwarf",
+            )
+
+        assert result == {"name": "Fine Forge"}
+        assert score.overall_score == 8.6
+        assert mock_client.agenerate_json_batch.await_count == 1
+        assert generator.stats.total_iterations == 1
+
     def test_generate_component(self):
         """Should generate a component with quality score added."""
         mock_client = MagicMock()
-        mock_client.generate_json.side_effect = [
-            {"name_fragment": "Deep Forge", "narrative_hook": "Ancient halls"},
-            {
+        mock_client.aclose = AsyncMock()
+        mock_client.agenerate_json_batch = AsyncMock(side_effect=[
+            [{"name_fragment": "Deep Forge", "narrative_hook": "Ancient halls"}],
+        ])
+        mock_client.agenerate_json = AsyncMock(side_effect=[
+            {"scores": [{
                 "strategic_score": 9,
                 "narrative_score": 9,
                 "authenticity_score": 9,
@@ -353,8 +745,8 @@ class TestQualityGenerator:
                 "strengths": ["immersive", "authentic"],
                 "weaknesses": [],
                 "improvement_suggestions": [],
-            },
-        ]
+            }]},
+        ])
 
         generator = QualityGenerator(
             target_score=9.0,
@@ -362,11 +754,12 @@ class TestQualityGenerator:
             client=mock_client,
         )
 
-        result = generator.generate_component(
-            category=ComponentCategory.DWARF_HOLD_FORGE,
-            prompt_template="Generate a dwarf forge",
-            index=1,
-        )
+        with generator:
+            result = generator.generate_component(
+                category=ComponentCategory.DWARF_HOLD_FORGE,
+                prompt_template="Generate a dwarf forge",
+                index=1,
+            )
 
         assert result is not None
         assert result["name_fragment"] == "Deep Forge"
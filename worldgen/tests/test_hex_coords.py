@@ -1,4 +1,5 @@
 """Tests for hex coordinate utilities."""
+import numpy as np
 import pytest
 from hex_coords import (
     HEX_DIRECTIONS,
@@ -6,6 +7,10 @@ from hex_coords import (
     get_opposite_edge,
     get_all_neighbors,
     distance,
+    distance_batch,
+    distance_jit,
+    neighbors_batch,
+    neighbors_jit,
 )
 
 
@@ -56,3 +61,31 @@ class TestDistance:
 
     def test_diagonal_distance(self):
         assert distance(0, 0, 2, -1) == 2
+
+
+class TestBatch:
+    @pytest.fixture
+    def grid(self):
+        rng = np.random.default_rng(42)
+        return rng.integers(-100, 100, size=(4, 10_000))
+
+    def test_distance_batch_matches_scalar(self, grid):
+        q1, r1, q2, r2 = grid
+        expected = [distance(*coords) for coords in zip(q1, r1, q2, r2)]
+        assert distance_batch(q1, r1, q2, r2).tolist() == expected
+
+    def test_neighbors_batch_matches_scalar(self, grid):
+        q, r = grid[0], grid[1]
+        nq, nr = neighbors_batch(q, r)
+        assert nq.shape == nr.shape == (6, len(q))
+        for i in range(0, len(q), 97):
+            expected = [get_neighbor(int(q[i]), int(r[i]), edge) for edge in range(6)]
+            assert list(zip(nq[:, i].tolist(), nr[:, i].tolist())) == expected
+
+    def test_distance_jit_matches_scalar(self, grid):
+        for q1, r1, q2, r2 in grid[:, :500].T.tolist():
+            assert distance_jit(q1, r1, q2, r2) == distance(q1, r1, q2, r2)
+
+    def test_neighbors_jit_matches_scalar(self):
+        expected = [get_neighbor(3, -2, edge) for edge in range(6)]
+        assert [tuple(n) for n in neighbors_jit(3, -2).tolist()] == expected
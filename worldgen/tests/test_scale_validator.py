@@ -5,13 +5,29 @@ from schemas import TaggedHex, ScaleValidation
 from scale_validator import ScaleValidator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validator():
-    return ScaleValidator(threshold=7.0)
+    """One validator (and HTTP client) shared by the module; tests only patch _call_llm."""
+    with ScaleValidator(threshold=7.0) as v:
+        yield v
+
+
+@pytest.fixture(scope="module")
+def patched_llm(validator):
+    """Patch the validator's LLM call once for the whole module."""
+    with patch.object(validator, "_call_llm") as m:
+        yield m
+
+
+@pytest.fixture
+def mock_llm(patched_llm):
+    """The module-wide LLM mock, reset for each test."""
+    patched_llm.reset_mock(return_value=True, side_effect=True)
+    return patched_llm
 
 
 class TestScaleValidation:
-    def test_good_scale_description_passes(self, validator):
+    def test_good_scale_description_passes(self, validator, mock_llm):
         """Description fitting 100m scale should pass."""
         hex = TaggedHex(
             q=0, r=0,
@@ -21,14 +37,13 @@ class TestScaleValidation:
             edge_types=["wilderness"] * 6,
         )
 
-        with patch.object(validator, '_call_llm') as mock_llm:
-            mock_llm.return_value = {"score": 9, "feedback": "Good 100m scale"}
-            result = validator.validate(hex)
+        mock_llm.return_value = {"score": 9, "feedback": "Good 100m scale"}
+        result = validator.validate(hex)
 
         assert result.passes
         assert result.score >= 7.0
 
-    def test_too_large_description_fails(self, validator):
+    def test_too_large_description_fails(self, validator, mock_llm):
         """Description suggesting region-scale should fail."""
         hex = TaggedHex(
             q=0, r=0,
@@ -38,14 +53,13 @@ class TestScaleValidation:
             edge_types=["wilderness"] * 6,
         )
 
-        with patch.object(validator, '_call_llm') as mock_llm:
-            mock_llm.return_value = {"score": 3, "feedback": "Too large - describes miles"}
-            result = validator.validate(hex)
+        mock_llm.return_value = {"score": 3, "feedback": "Too large - describes miles"}
+        result = validator.validate(hex)
 
         assert not result.passes
         assert result.score < 7.0
 
-    def test_too_small_description_fails(self, validator):
+    def test_too_small_description_fails(self, validator, mock_llm):
         """Description suggesting room-scale should fail."""
         hex = TaggedHex(
             q=0, r=0,
@@ -55,9 +69,8 @@ class TestScaleValidation:
             edge_types=["tunnel", "blocked", "blocked", "blocked", "blocked", "blocked"],
         )
 
-        with patch.object(validator, '_call_llm') as mock_llm:
-            mock_llm.return_value = {"score": 2, "feedback": "Too small - a closet is not 100m"}
-            result = validator.validate(hex)
+        mock_llm.return_value = {"score": 2, "feedback": "Too small - a closet is not 100m"}
+        result = validator.validate(hex)
 
         assert not result.passes
 
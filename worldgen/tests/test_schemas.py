@@ -1,6 +1,8 @@
 """Tests for schema models."""
 
+import numpy as np
 import pytest
+from pydantic import ValidationError
 from worldgen.schemas.base import HexCoord, Terrain, Species, SpeciesFitness
 from worldgen.schemas.component import Component, ComponentCategory, ConnectionPoint
 from worldgen.schemas.template import (
@@ -25,24 +27,26 @@ from worldgen.schemas.world import WorldHex, HexMap, AssembledWorld
 
 
 class TestHexCoord:
-    def test_distance_to_same_hex(self):
-        a = HexCoord(q=0, r=0)
-        assert a.distance_to(a) == 0
-
-    def test_distance_to_adjacent(self):
-        a = HexCoord(q=0, r=0)
-        b = HexCoord(q=1, r=0)
-        assert a.distance_to(b) == 1
-
-    def test_distance_to_diagonal(self):
-        a = HexCoord(q=0, r=0)
-        b = HexCoord(q=2, r=-1)
-        assert a.distance_to(b) == 2
-
-    def test_distance_symmetric(self):
-        a = HexCoord(q=3, r=-2)
-        b = HexCoord(q=-1, r=4)
-        assert a.distance_to(b) == b.distance_to(a)
+    @pytest.mark.parametrize(
+        "q1,r1,q2,r2,expected",
+        [
+            (0, 0, 0, 0, 0),    # same hex
+            (0, 0, 1, 0, 1),    # adjacent
+            (0, 0, 2, -1, 2),   # diagonal
+            (3, -2, -1, 4, 6),  # symmetric pair...
+            (-1, 4, 3, -2, 6),  # ...in both directions
+        ],
+    )
+    def test_distance_to(self, q1, r1, q2, r2, expected):
+        assert HexCoord(q=q1, r=r1).distance_to(HexCoord(q=q2, r=r2)) == expected
+
+    def test_distance_matches_jit_kernel(self):
+        from worldgen.hex_coords import distance_jit
+
+        rng = np.random.default_rng(7)
+        for q1, r1, q2, r2 in rng.integers(-50, 50, size=(200, 4)).tolist():
+            a, b = HexCoord(q=q1, r=r1), HexCoord(q=q2, r=r2)
+            assert a.distance_to(b) == distance_jit(q1, r1, q2, r2)
 
     def test_hash_equality(self):
         a = HexCoord(q=5, r=3)
@@ -50,6 +54,18 @@ class TestHexCoord:
         assert hash(a) == hash(b)
         assert a == b
 
+    def test_frozen(self):
+        a = HexCoord(q=1, r=2)
+        with pytest.raises(ValidationError):
+            a.q = 3
+
+
+class TestSpeciesFitness:
+    def test_frozen(self):
+        fitness = SpeciesFitness(human=0.5, dwarf=0.5, elf=0.5)
+        with pytest.raises(ValidationError):
+            fitness.dwarf = 0.9
+
 
 class TestEnums:
     def test_terrain_values(self):
@@ -189,6 +205,37 @@ class TestAssembledCluster:
         assert cluster.get_component_at((1, 0)) == "comp_b"
         assert cluster.get_component_at((2, 0)) is None
 
+    def test_footprint_array(self):
+        cluster = AssembledCluster(
+            template_id="test",
+            instance_id="test_0",
+            components={},
+            layout={},
+            footprint=[(0, 0), (1, 0), (0, 1)],
+        )
+        assert cluster.footprint_array.dtype == np.int32
+        assert cluster.footprint_array.tolist() == [[0, 0], [1, 0], [0, 1]]
+        assert "footprint_array" not in cluster.model_dump()
+
+    def test_footprint_array_tracks_footprint_and_keeps_equality(self):
+        def make():
+            return AssembledCluster(
+                template_id="test",
+                instance_id="test_0",
+                components={},
+                layout={},
+                footprint=[(0, 0), (1, 0)],
+            )
+
+        a, b = make(), make()
+        a.footprint_array
+        b.footprint_array
+        assert a == b
+
+        a.footprint.append((2, 0))
+        assert a.footprint_array.tolist() == [[0, 0], [1, 0], [2, 0]]
+        assert a != b
+
 
 class TestConnectorCollection:
     def test_create_minimal_connector(self):
@@ -1,5 +1,6 @@
 """Tests for seed generation."""
 
+import io
 import tempfile
 from pathlib import Path
 
@@ -9,6 +10,12 @@ from worldgen.seeds import SeedGenerator
 from worldgen.schemas import WorldSeed, ClusterPlacement, LayoutHint
 
 
+@pytest.fixture(scope="module")
+def gen():
+    """Dwarf-hold generator shared by the module (generation is stateless)."""
+    return SeedGenerator(["dwarf_hold_major"])
+
+
 class TestSeedGenerator:
     def test_create_generator(self):
         """Test that SeedGenerator can be instantiated."""
@@ -16,11 +23,8 @@ class TestSeedGenerator:
         gen = SeedGenerator(templates)
         assert gen.available_templates == templates
 
-    def test_generate_seed_basic(self):
+    def test_generate_seed_basic(self, gen):
         """Test generating a basic seed."""
-        templates = ["dwarf_hold_major"]
-        gen = SeedGenerator(templates)
-
         seed = gen.generate_seed(
             seed_id=42,
             num_dwarf_holds=2,
@@ -50,11 +54,8 @@ class TestSeedGenerator:
         assert seed is not None
         assert len(seed.clusters) == 0
 
-    def test_generate_seed_creates_layout_hints(self):
+    def test_generate_seed_creates_layout_hints(self, gen):
         """Test that layout hints are created for clusters."""
-        templates = ["dwarf_hold_major"]
-        gen = SeedGenerator(templates)
-
         seed = gen.generate_seed(
             seed_id=123,
             num_dwarf_holds=2,
@@ -66,22 +67,25 @@ class TestSeedGenerator:
         for hint in seed.layout_hints:
             assert "terrain:mountains" in hint.hints
 
-    def test_generate_seed_deterministic(self):
+    def test_generate_seed_deterministic(self, gen):
         """Test that same seed_id produces same result."""
-        templates = ["dwarf_hold_major"]
-        gen = SeedGenerator(templates)
-
         seed1 = gen.generate_seed(seed_id=42, num_dwarf_holds=3)
         seed2 = gen.generate_seed(seed_id=42, num_dwarf_holds=3)
 
         assert seed1.clusters[0].region_hint == seed2.clusters[0].region_hint
         assert seed1.clusters[1].region_hint == seed2.clusters[1].region_hint
 
-    def test_generate_seed_different_seeds_differ(self):
-        """Test that different seed_ids produce different results."""
-        templates = ["dwarf_hold_major"]
-        gen = SeedGenerator(templates)
+    def test_generate_seeds_batch_matches_single(self, gen):
+        """Batched seeds are the same as generating each seed_id alone."""
+        batch = gen.generate_seeds_batch([1, 42, 999], num_dwarf_holds=4, world_radius=50)
+
+        assert batch == [
+            gen.generate_seed(seed_id=i, num_dwarf_holds=4, world_radius=50)
+            for i in [1, 42, 999]
+        ]
 
+    def test_generate_seed_different_seeds_differ(self, gen):
+        """Test that different seed_ids produce different results."""
         seed1 = gen.generate_seed(seed_id=1, num_dwarf_holds=10)
         seed2 = gen.generate_seed(seed_id=999, num_dwarf_holds=10)
 
@@ -93,11 +97,18 @@ class TestSeedGenerator:
         assert all(h in ["N", "NE", "NW"] for h in hints1)
         assert all(h in ["N", "NE", "NW"] for h in hints2)
 
-    def test_save_and_load_seed(self):
-        """Test saving and loading a seed to/from JSON."""
-        templates = ["dwarf_hold_major"]
-        gen = SeedGenerator(templates)
+    def test_save_and_load_seed_stream(self, gen):
+        """Seeds round-trip through an in-memory text stream."""
+        seed = gen.generate_seed(seed_id=42, num_dwarf_holds=2)
+
+        buf = io.StringIO()
+        gen.save_seed(seed, buf)
+        buf.seek(0)
 
+        assert gen.load_seed(buf) == seed
+
+    def test_save_and_load_seed(self, gen):
+        """Test saving and loading a seed to/from a JSON file."""
         seed = gen.generate_seed(seed_id=42, num_dwarf_holds=2)
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -114,21 +125,24 @@ class TestSeedGenerator:
             assert len(loaded.clusters) == len(seed.clusters)
             assert loaded.clusters[0].template_id == seed.clusters[0].template_id
 
-    def test_cluster_placement_has_unique_instance_ids(self):
-        """Test that generated clusters have unique instance IDs."""
-        templates = ["dwarf_hold_major"]
-        gen = SeedGenerator(templates)
+    def test_save_and_load_seed_str_path(self, gen, tmp_path):
+        """Plain string paths work as well as Path objects."""
+        seed = gen.generate_seed(seed_id=42, num_dwarf_holds=2)
+        seed_path = str(tmp_path / "seeds" / "test_seed.json")
+
+        gen.save_seed(seed, seed_path)
+
+        assert gen.load_seed(seed_path) == seed
 
+    def test_cluster_placement_has_unique_instance_ids(self, gen):
+        """Test that generated clusters have unique instance IDs."""
         seed = gen.generate_seed(seed_id=1, num_dwarf_holds=5)
 
         instance_ids = [c.instance_id for c in seed.clusters]
         assert len(instance_ids) == len(set(instance_ids))  # All unique
 
-    def test_world_seed_has_default_values(self):
+    def test_world_seed_has_default_values(self, gen):
         """Test that WorldSeed has expected default values."""
-        templates = ["dwarf_hold_major"]
-        gen = SeedGenerator(templates)
-
         seed = gen.generate_seed(seed_id=1, num_dwarf_holds=1)
 
         assert seed.version == 1
@@ -4,6 +4,18 @@ from pydantic import ValidationError
 from schemas import EdgeType, TaggedHex, HexCluster
 
 
+@pytest.fixture(scope="module")
+def valid_hex_template():
+    """One validated hex; tests clone it with model_copy instead of re-validating."""
+    return TaggedHex(
+        q=0, r=0,
+        name="Hex 0",
+        description="Test hex",
+        tags=["surface", "wild"],
+        edge_types=["wilderness"] * 6,
+    )
+
+
 class TestEdgeType:
     def test_valid_edge_types(self):
         assert EdgeType.TUNNEL == "tunnel"
@@ -59,29 +71,17 @@ class TestTaggedHex:
 
 
 class TestHexCluster:
-    def test_cluster_requires_20_hexes(self):
+    def test_cluster_requires_20_hexes(self, valid_hex_template):
         hexes = [
-            TaggedHex(
-                q=i, r=0,
-                name=f"Hex {i}",
-                description="Test hex",
-                tags=["surface", "wild"],
-                edge_types=["wilderness"] * 6,
-            )
+            valid_hex_template.model_copy(update={"q": i, "name": f"Hex {i}"})
             for i in range(20)
         ]
         cluster = HexCluster(hexes=hexes)
         assert len(cluster.hexes) == 20
 
-    def test_cluster_rejects_fewer_than_20(self):
+    def test_cluster_rejects_fewer_than_20(self, valid_hex_template):
         hexes = [
-            TaggedHex(
-                q=i, r=0,
-                name=f"Hex {i}",
-                description="Test hex",
-                tags=["surface"],
-                edge_types=["wilderness"] * 6,
-            )
+            valid_hex_template.model_copy(update={"q": i, "name": f"Hex {i}"})
             for i in range(10)  # Only 10
         ]
         with pytest.raises(ValidationError):
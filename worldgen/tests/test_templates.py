@@ -1,24 +1,66 @@
 """Tests for template loading."""
 
+import os
 from pathlib import Path
 import tempfile
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from worldgen.templates.template_loader import TemplateLoader
 from worldgen.schemas import ClusterTemplate, Species
 
 
+@pytest.fixture(scope="module")
+def loader():
+    """Default-directory loader shared by the module (it holds no state)."""
+    return TemplateLoader()
+
+
 class TestTemplateLoader:
-    def test_load_single_template(self):
-        loader = TemplateLoader()
+    def test_load_single_template(self, loader):
         template = loader.load_template("dwarf/hold_major")
         assert template is not None
         assert template.id == "dwarf_hold_major"
         assert template.species == Species.DWARF
 
-    def test_load_all_templates(self):
-        loader = TemplateLoader()
+    def test_load_all_templates(self, loader):
         templates = loader.load_all()
         assert len(templates) >= 1
         assert "dwarf_hold_major" in templates
+
+    def test_load_all_is_cached_until_files_change(self, tmp_path):
+        source = TemplateLoader().templates_dir / "dwarf" / "hold_major.yaml"
+        target = tmp_path / "hold_major.yaml"
+        target.write_text(source.read_text())
+        loader = TemplateLoader(tmp_path)
+
+        with patch("worldgen.templates.template_loader.yaml.safe_load", wraps=yaml.safe_load) as parse:
+            first = loader.load_all()
+            assert TemplateLoader(tmp_path).load_all() == first
+            assert parse.call_count == 1
+
+            # Same mtime, different size: still reloaded
+            stat = target.stat()
+            target.write_text(target.read_text().replace("dwarf_hold_major", "dwarf_hold_edited"))
+            os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert list(loader.load_all()) == ["dwarf_hold_edited"]
+            assert parse.call_count == 2
+
+        target.unlink()
+        assert loader.load_all() == {}
+
+    def test_load_all_returns_independent_copies(self, tmp_path):
+        source = TemplateLoader().templates_dir / "dwarf" / "hold_major.yaml"
+        (tmp_path / "hold_major.yaml").write_text(source.read_text())
+        loader = TemplateLoader(tmp_path)
+
+        first = loader.load_all()["dwarf_hold_major"]
+        first.slots.clear()
+        first.name = "Mutated"
+
+        again = loader.load_all()["dwarf_hold_major"]
+        assert again is not first
+        assert again.name != "Mutated"
+        assert again.slots
@@ -0,0 +1,235 @@
+"""Tests for hex region validation (validator.py).
+
+validator.py imports from the legacy flat ``schemas.py`` module, which the
+``schemas/`` package shadows on a normal import, so both are loaded here by
+path with ``schemas`` pointed at the legacy module while validator.py runs.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_validator():
+    legacy_schemas = _load("legacy_schemas", _ROOT / "schemas.py")
+    saved = sys.modules.get("schemas")
+    sys.modules["schemas"] = legacy_schemas
+    try:
+        return legacy_schemas, _load("legacy_validator", _ROOT / "validator.py")
+    finally:
+        if saved is None:
+            sys.modules.pop("schemas", None)
+        else:
+            sys.modules["schemas"] = saved
+
+
+schemas, validator = _load_validator()
+HexTile, HexRegion, GenerationSeed = schemas.HexTile, schemas.HexRegion, schemas.GenerationSeed
+TerrainType, Resource, ResourceType = schemas.TerrainType, schemas.Resource, schemas.ResourceType
+HexValidator, ValidationResult = validator.HexValidator, validator.ValidationResult
+
+
+def make_hex(q=0, r=0, terrain=TerrainType.PLAINS, elevation=0.5, moisture=0.5, **kwargs):
+    return HexTile(q=q, r=r, terrain=terrain, elevation=elevation, moisture=moisture, **kwargs)
+
+
+def make_region(hexes, name="Test Region"):
+    return HexRegion(name=name, description="A test region", hexes=hexes, theme="test")
+
+
+def line(n, terrain=TerrainType.PLAINS):
+    """n connected hexes along q, alternating terrain so variety is fine."""
+    return [make_hex(q=i, terrain=terrain if i % 2 else TerrainType.FOREST) for i in range(n)]
+
+
+@pytest.fixture
+def hex_validator():
+    return HexValidator()
+
+
+class TestValidationResult:
+    def test_equality(self):
+        assert ValidationResult(valid=True) == ValidationResult(valid=True)
+        assert ValidationResult(valid=True) != ValidationResult(valid=False)
+
+        a = ValidationResult()
+        a.add_error("bad {}", 1)
+        assert a == ValidationResult(valid=False, errors=["bad 1"])
+
+    def test_messages_are_read_only(self):
+        result = ValidationResult()
+        with pytest.raises(AttributeError):
+            result.errors.append("lost")
+        with pytest.raises(AttributeError):
+            result.warnings.extend(["lost"])
+        assert result.valid
+
+    def test_formatting_is_deferred_until_read(self):
+        calls = []
+
+        class Arg:
+            def __format__(self, spec):
+                calls.append(spec)
+                return "arg"
+
+        inner = ValidationResult()
+        inner.add_error("value {}", Arg())
+        outer = ValidationResult()
+        outer.merge_errors(inner, "Hex ({},{}): ", 1, 2)
+        assert calls == []
+        assert not outer.valid
+
+        assert outer.errors == ("Hex (1,2): value arg",)
+        assert len(calls) == 1
+
+    def test_literal_braces_are_kept(self):
+        inner = ValidationResult()
+        inner.add_error("no {placeholders} here")
+        outer = ValidationResult()
+        outer.merge_errors(inner, "Region '{}': ", "{}")
+        assert outer.errors == ("Region '{}': no {placeholders} here",)
+
+
+class TestHexRules:
+    def test_water_messages_in_check_order(self, hex_validator):
+        h = make_hex(terrain=TerrainType.WATER, elevation=0.5, moisture=0.5, traversable=True)
+        h = h.model_copy(update={"resources": [
+            Resource(type=ResourceType.FISH, abundance=0.5),
+            Resource(type=ResourceType.IRON, abundance=0.5),
+            Resource(type=ResourceType.FISH, abundance=0.5),
+            Resource(type=ResourceType.GOLD, abundance=0.5),
+        ]})
+
+        result = hex_validator.validate_hex(h)
+
+        assert result.errors == (
+            "Water must have elevation <= 0.3, got 0.5",
+            "Max 3 resources per hex, got 4",
+        )
+        assert result.warnings == (
+            "Water typically has moisture 1.0, got 0.5",
+            "Water hexes are typically not traversable by land units",
+            "Water hex has land resources: ['iron', 'gold']",
+        )
+
+    @pytest.mark.parametrize(
+        "terrain,elevation,moisture,errors,warnings",
+        [
+            (TerrainType.MOUNTAINS, 0.6, 0.5, ("Mountains must have elevation >= 0.7, got 0.6",), ()),
+            (TerrainType.MOUNTAINS, 0.97, 0.5, (), ("Very high mountains (>0.95) are usually impassable",)),
+            (TerrainType.HILLS, 0.9, 0.5, (), ("Hills typically have elevation 0.4-0.8, got 0.9",)),
+            (TerrainType.DESERT, 0.5, 0.3, ("Desert must have moisture <= 0.2, got 0.3",), ()),
+            (TerrainType.SWAMP, 0.5, 0.6, ("Swamp must have moisture >= 0.7, got 0.6",), ()),
+            (TerrainType.PLAINS, 0.0, 1.0, (), ()),
+        ],
+    )
+    def test_terrain_rules(self, hex_validator, terrain, elevation, moisture, errors, warnings):
+        result = hex_validator.validate_hex(make_hex(terrain=terrain, elevation=elevation, moisture=moisture))
+        assert result.errors == errors
+        assert result.warnings == warnings
+        assert result.valid == (not errors)
+
+    @pytest.mark.parametrize("terrain", list(TerrainType))
+    def test_fused_pass_matches_individual_checks(self, hex_validator, terrain):
+        for elevation in (0.0, 0.35, 0.6, 0.9, 0.97):
+            for moisture in (0.1, 0.5, 1.0):
+                h = make_hex(terrain=terrain, elevation=elevation, moisture=moisture, traversable=True)
+                combined = ValidationResult()
+                for check in (
+                    hex_validator._check_terrain_elevation,
+                    hex_validator._check_terrain_moisture,
+                    hex_validator._check_traversability,
+                    hex_validator._check_resource_limits,
+                ):
+                    combined.merge(check(h))
+                assert hex_validator.validate_hex(h) == combined
+
+
+class TestRegionChecks:
+    def test_duplicate_coordinates_reported_once_each(self, hex_validator):
+        hexes = [make_hex(0, 0), make_hex(0, 0), make_hex(0, 0), make_hex(1, 0), make_hex(1, 0)]
+        result = hex_validator.validate_region(make_region(hexes))
+        assert result.errors == (
+            "Duplicate coordinates: (0, 0) (3 hexes)",
+            "Duplicate coordinates: (1, 0) (2 hexes)",
+        )
+
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_disconnected_hexes(self, hex_validator, monkeypatch, use_numba):
+        if use_numba and not validator.HAS_NUMBA:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(validator, "HAS_NUMBA", use_numba)
+        hexes = line(4) + [make_hex(10, 10, TerrainType.TUNDRA), make_hex(11, 10, TerrainType.HILLS, 0.5)]
+        result = hex_validator.validate_region(make_region(hexes))
+        # Counted from the lowest coordinate key, (0, 0), on both paths
+        assert result.warnings == ("Region has 2 disconnected hexes",)
+
+    def test_low_terrain_variety_warns(self, hex_validator):
+        hexes = [make_hex(q=i) for i in range(6)]
+        result = hex_validator.validate_region(make_region(hexes))
+        assert result.warnings == ("Region is 100% plains - limited variety",)
+
+    def test_region_name_with_braces(self, hex_validator):
+        region = make_region([make_hex(0, 0, TerrainType.DESERT, moisture=0.5)], name="The {} Wastes")
+        seed = GenerationSeed(seed_id="s", regions=[region], generation_prompt="p")
+        result = hex_validator.validate_seed(seed)
+        assert result.errors == (
+            "Region 'The {} Wastes': Hex (0,0): Desert must have moisture <= 0.2, got 0.5",
+        )
+
+
+class TestShortCircuit:
+    def test_stops_on_hex_failure(self, hex_validator):
+        region = make_region(line(3) + [make_hex(3, 0, TerrainType.MOUNTAINS, elevation=0.1)])
+        assert hex_validator.validate_region(region, short_circuit=True) == ValidationResult(valid=False)
+        assert not hex_validator.validate_region(region).valid
+
+    def test_stops_on_region_failure(self, hex_validator):
+        region = make_region([make_hex(0, 0), make_hex(0, 0)])
+        assert hex_validator.validate_region(region, short_circuit=True) == ValidationResult(valid=False)
+
+    def test_valid_region_gets_full_result(self, hex_validator):
+        region = make_region([make_hex(q=i) for i in range(6)])
+        assert hex_validator.validate_region(region, short_circuit=True) == hex_validator.validate_region(region)
+
+    def test_seed(self, hex_validator):
+        good = make_region(line(3), name="Good")
+        bad = make_region([make_hex(0, 0, TerrainType.SWAMP, moisture=0.1)], name="Bad")
+        seed = GenerationSeed(seed_id="s", regions=[good, bad], generation_prompt="p")
+        assert hex_validator.validate_seed(seed, short_circuit=True) == ValidationResult(valid=False)
+        assert len(hex_validator.validate_seed(seed).errors) == 1
+
+    def test_quick_validate(self):
+        assert validator.quick_validate(make_region(line(3)))
+        assert not validator.quick_validate(make_region([make_hex(0, 0), make_hex(0, 0)]))
+        assert not validator.quick_validate(
+            make_region([make_hex(0, 0, TerrainType.WATER, elevation=0.9, moisture=1.0)])
+        )
+
+
+class TestReuseScratch:
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_repeated_calls_match_fresh_validator(self, monkeypatch, use_numba):
+        if use_numba and not validator.HAS_NUMBA:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(validator, "HAS_NUMBA", use_numba)
+        regions = [
+            make_region(line(5) + [make_hex(20, 20)]),
+            make_region(line(8)),
+            make_region([make_hex(0, 0), make_hex(0, 0), make_hex(2, 0)]),
+            make_region(line(5) + [make_hex(20, 20)]),
+        ]
+        reusing = HexValidator(reuse_scratch=True)
+        for region in regions * 2:
+            assert reusing.validate_region(region) == HexValidator().validate_region(region)
@@ -0,0 +1,36 @@
+"""Tests for the validator's compiled connectivity kernel."""
+import numpy as np
+import pytest
+from _validator_numba import connected_count, pack_key, _connected_count_kernel
+
+
+def _keys(pairs):
+    qs, rs = zip(*pairs)
+    return np.unique(pack_key(np.array(qs, dtype=np.int64), np.array(rs, dtype=np.int64)))
+
+
+class TestConnectedCount:
+    def test_single_hex(self):
+        assert connected_count(_keys([(0, 0)])) == 1
+
+    def test_ring_is_connected(self):
+        ring = [(0, 0), (1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)]
+        assert connected_count(_keys(ring)) == 7
+
+    def test_island_not_reached(self):
+        assert connected_count(_keys([(0, 0), (1, 0), (5, 5)])) == 2
+
+    def test_negative_coordinates(self):
+        assert connected_count(_keys([(-3, -4), (-2, -4), (-2, -5)])) == 3
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_jit_matches_python_kernel(self, seed):
+        rng = np.random.default_rng(seed)
+        pairs = {tuple(p) for p in rng.integers(-6, 6, size=(80, 2)).tolist()}
+        keys = _keys(pairs)
+        assert connected_count(keys) == _connected_count_kernel(keys)
+
+    def test_pack_key_matches_for_python_ints(self):
+        for q, r in [(0, 0), (-1, -1), (7, -3), (-5, 9)]:
+            arr = pack_key(np.array([q], dtype=np.int64), np.array([r], dtype=np.int64))
+            assert pack_key(q, r) == arr[0]
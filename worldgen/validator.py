@@ -1,206 +1,411 @@
 """Validation logic for generated hex data."""
 
-from dataclasses import dataclass, field
-from typing import Callable
+from collections import Counter, deque
+from typing import Callable, NamedTuple
 
-from schemas import HexRegion, HexTile, TerrainType, GenerationSeed
+import numpy as np
 
+from _validator_numba import HAS_NUMBA, connected_count, pack_key
+from schemas import HexRegion, HexTile, TerrainType, GenerationSeed, ResourceType
+
+# Resources that make sense on a water hex
+_WATER_ALLOWED_RESOURCES = frozenset({ResourceType.FISH})
+
+# Axial neighbor offsets for the pure-Python connectivity walk
+_HEX_NEIGHBOR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, -1), (-1, 1))
 
-@dataclass
-class ValidationResult:
-    """Result of validation check."""
-    valid: bool
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
 
-    def add_error(self, msg: str):
-        self.errors.append(msg)
+class ValidationResult:
+    """Result of validation check.
+
+    Messages are stored as ``(template, args)`` records and only formatted
+    when ``errors``/``warnings`` are read, so callers that just need ``valid``
+    (e.g. ``quick_validate``) never pay for string formatting. Both read as
+    tuples; message lists are allocated on first add.
+    """
+
+    __slots__ = ("valid", "_errors", "_warnings")
+
+    def __init__(
+        self,
+        valid: bool = True,
+        errors: list[str] | None = None,
+        warnings: list[str] | None = None,
+    ):
+        self.valid = valid
+        self._errors = [(m, ()) for m in errors] if errors else None
+        self._warnings = [(m, ()) for m in warnings] if warnings else None
+
+    @staticmethod
+    def _format(records) -> tuple[str, ...]:
+        if not records:
+            return ()
+        return tuple(fmt.format(*args) if args else fmt for fmt, args in records)
+
+    # Read-only snapshots: mutating them would not reach the stored records,
+    # so they are tuples and append/extend fail loudly. Use add_error/add_warning.
+    @property
+    def errors(self) -> tuple[str, ...]:
+        return self._format(self._errors)
+
+    @property
+    def warnings(self) -> tuple[str, ...]:
+        return self._format(self._warnings)
+
+    def add_error(self, msg: str, *args):
+        """Record an error; with ``args``, ``msg`` is a ``str.format`` template."""
+        if self._errors is None:
+            self._errors = []
+        self._errors.append((msg, args))
         self.valid = False
 
-    def add_warning(self, msg: str):
-        self.warnings.append(msg)
+    def add_warning(self, msg: str, *args):
+        """Record a warning; with ``args``, ``msg`` is a ``str.format`` template."""
+        if self._warnings is None:
+            self._warnings = []
+        self._warnings.append((msg, args))
+
+    def merge_warnings(self, other: "ValidationResult"):
+        if not other._warnings:
+            return
+        if self._warnings is None:
+            self._warnings = []
+        self._warnings.extend(other._warnings)
+
+    def merge_errors(self, other: "ValidationResult", prefix: str, *prefix_args):
+        """Add ``other``'s errors, each prefixed by the template ``prefix``."""
+        if not other._errors:
+            return
+        for fmt, args in other._errors:
+            if not args:
+                fmt = fmt.replace("{", "{{").replace("}", "}}")
+            self.add_error(prefix + fmt, *prefix_args, *args)
 
     def merge(self, other: "ValidationResult"):
-        self.errors.extend(other.errors)
-        self.warnings.extend(other.warnings)
+        if other._errors:
+            if self._errors is None:
+                self._errors = []
+            self._errors.extend(other._errors)
+        self.merge_warnings(other)
         if not other.valid:
             self.valid = False
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ValidationResult):
+            return NotImplemented
+        return (
+            self.valid == other.valid
+            and self.errors == other.errors
+            and self.warnings == other.warnings
+        )
+
+    __hash__ = None  # mutable, like the dataclass it replaced
+
+    def __repr__(self) -> str:
+        return f"ValidationResult(valid={self.valid}, errors={self.errors}, warnings={self.warnings})"
+
+
+class _RegionColumns(NamedTuple):
+    """Per-hex attributes of a region, read once for all region checks."""
+    qs: list[int]
+    rs: list[int]
+    terrains: list[TerrainType]
+
+    @classmethod
+    def of(cls, region: HexRegion) -> "_RegionColumns":
+        hexes = region.hexes
+        return cls(
+            [h.q for h in hexes],
+            [h.r for h in hexes],
+            [h.terrain for h in hexes],
+        )
+
+
+# Per-hex rules. Each appends to the result in place and only applies to the
+# terrains it is registered for below.
+
+def _mountain_elevation(h: HexTile, result: ValidationResult) -> None:
+    if h.elevation < 0.7:
+        result.add_error("Mountains must have elevation >= 0.7, got {}", h.elevation)
+
+
+def _water_elevation(h: HexTile, result: ValidationResult) -> None:
+    if h.elevation > 0.3:
+        result.add_error("Water must have elevation <= 0.3, got {}", h.elevation)
+
+
+def _hills_elevation(h: HexTile, result: ValidationResult) -> None:
+    if not (0.4 <= h.elevation <= 0.8):
+        result.add_warning("Hills typically have elevation 0.4-0.8, got {}", h.elevation)
+
+
+def _desert_moisture(h: HexTile, result: ValidationResult) -> None:
+    if h.moisture > 0.2:
+        result.add_error("Desert must have moisture <= 0.2, got {}", h.moisture)
+
+
+def _swamp_moisture(h: HexTile, result: ValidationResult) -> None:
+    if h.moisture < 0.7:
+        result.add_error("Swamp must have moisture >= 0.7, got {}", h.moisture)
+
+
+def _water_moisture(h: HexTile, result: ValidationResult) -> None:
+    if h.moisture < 1.0:
+        result.add_warning("Water typically has moisture 1.0, got {}", h.moisture)
+
+
+def _mountain_traversability(h: HexTile, result: ValidationResult) -> None:
+    if h.elevation > 0.95 and h.traversable:
+        result.add_warning("Very high mountains (>0.95) are usually impassable")
+
+
+def _water_traversability(h: HexTile, result: ValidationResult) -> None:
+    if h.traversable:
+        result.add_warning("Water hexes are typically not traversable by land units")
+
+
+def _resource_count(h: HexTile, result: ValidationResult) -> None:
+    if len(h.resources) > 3:
+        result.add_error("Max 3 resources per hex, got {}", len(h.resources))
+
+
+def _water_resources(h: HexTile, result: ValidationResult) -> None:
+    land_resources = [r for r in h.resources if r.type not in _WATER_ALLOWED_RESOURCES]
+    if land_resources:
+        result.add_warning("Water hex has land resources: {}", [r.type.value for r in land_resources])
+
+
+_HexRule = Callable[[HexTile, ValidationResult], None]
+_RuleTable = dict[TerrainType, tuple[_HexRule, ...]]
+
+# One table per HexValidator._check_* method: terrain -> rules, in report order
+_ELEVATION_RULES: _RuleTable = {
+    TerrainType.MOUNTAINS: (_mountain_elevation,),
+    TerrainType.WATER: (_water_elevation,),
+    TerrainType.HILLS: (_hills_elevation,),
+}
+_MOISTURE_RULES: _RuleTable = {
+    TerrainType.DESERT: (_desert_moisture,),
+    TerrainType.SWAMP: (_swamp_moisture,),
+    TerrainType.WATER: (_water_moisture,),
+}
+_TRAVERSABILITY_RULES: _RuleTable = {
+    TerrainType.MOUNTAINS: (_mountain_traversability,),
+    TerrainType.WATER: (_water_traversability,),
+}
+_RESOURCE_RULES: _RuleTable = {
+    t: (_resource_count, _water_resources) if t == TerrainType.WATER else (_resource_count,)
+    for t in TerrainType
+}
+
+# All of a terrain's rules in check order, so the fused pass reports messages
+# in the same order as running the four _check_* methods one after another
+_HEX_RULES: _RuleTable = {
+    t: sum(
+        (table.get(t, ()) for table in
+         (_ELEVATION_RULES, _MOISTURE_RULES, _TRAVERSABILITY_RULES, _RESOURCE_RULES)),
+        (),
+    )
+    for t in TerrainType
+}
+
+
+def _apply_rules(h: HexTile, table: _RuleTable) -> ValidationResult:
+    result = ValidationResult(valid=True)
+    for rule in table.get(h.terrain, ()):
+        rule(h, result)
+    return result
+
 
 class HexValidator:
     """Validates hex regions against game invariants."""
 
-    def __init__(self):
-        self.hex_checks: list[Callable[[HexTile], ValidationResult]] = [
-            self._check_terrain_elevation,
-            self._check_terrain_moisture,
-            self._check_traversability,
-            self._check_resource_limits,
-        ]
-        self.region_checks: list[Callable[[HexRegion], ValidationResult]] = [
-            self._check_unique_coordinates,
-            self._check_connectivity,
-            self._check_terrain_distribution,
-        ]
+    def __init__(self, reuse_scratch: bool = False):
+        """
+        Args:
+            reuse_scratch: Clear and reuse the traversal/dedup containers across
+                calls instead of allocating new ones. Saves allocations in hot
+                loops, but the instance is then not safe to share between threads.
+        """
+        self._reuse_scratch = reuse_scratch
+        self._scratch_seen: set[tuple[int, int]] = set()
+        self._scratch_visited: set[tuple[int, int]] = set()
+        self._scratch_frontier: deque[tuple[int, int]] = deque()
+
+    def _scratch(self, buf):
+        """Cleared shared buffer when reusing scratch, else a new empty one."""
+        if self._reuse_scratch:
+            buf.clear()
+            return buf
+        return type(buf)()
 
     def validate_hex(self, hex_tile: HexTile) -> ValidationResult:
         """Validate a single hex tile."""
-        result = ValidationResult(valid=True)
-        for check in self.hex_checks:
-            result.merge(check(hex_tile))
-        return result
+        return self._check_hex_fused(hex_tile)
 
-    def validate_region(self, region: HexRegion) -> ValidationResult:
-        """Validate an entire region."""
+    def validate_region(self, region: HexRegion, short_circuit: bool = False) -> ValidationResult:
+        """Validate an entire region.
+
+        With ``short_circuit``, return ``ValidationResult(valid=False)`` at the
+        first failing check, without collecting or formatting messages.
+        """
         result = ValidationResult(valid=True)
 
         for hex_tile in region.hexes:
             hex_result = self.validate_hex(hex_tile)
             if not hex_result.valid:
-                for err in hex_result.errors:
-                    result.add_error(f"Hex ({hex_tile.q},{hex_tile.r}): {err}")
-            result.warnings.extend(hex_result.warnings)
-
-        for check in self.region_checks:
-            result.merge(check(region))
+                if short_circuit:
+                    return ValidationResult(valid=False)
+                result.merge_errors(hex_result, "Hex ({},{}): ", hex_tile.q, hex_tile.r)
+            result.merge_warnings(hex_result)
+
+        cols = _RegionColumns.of(region)
+        for check in self._REGION_CHECKS:
+            check_result = check(self, cols)
+            if short_circuit and not check_result.valid:
+                return ValidationResult(valid=False)
+            result.merge(check_result)
 
         return result
 
-    def validate_seed(self, seed: GenerationSeed) -> ValidationResult:
-        """Validate a complete generation seed."""
+    def validate_seed(self, seed: GenerationSeed, short_circuit: bool = False) -> ValidationResult:
+        """Validate a complete generation seed.
+
+        ``short_circuit`` stops at the first invalid region (see validate_region).
+        """
         result = ValidationResult(valid=True)
 
         for region in seed.regions:
-            region_result = self.validate_region(region)
+            region_result = self.validate_region(region, short_circuit=short_circuit)
             if not region_result.valid:
-                for err in region_result.errors:
-                    result.add_error(f"Region '{region.name}': {err}")
-            result.warnings.extend(region_result.warnings)
+                if short_circuit:
+                    return ValidationResult(valid=False)
+                result.merge_errors(region_result, "Region '{}': ", region.name)
+            result.merge_warnings(region_result)
 
         return result
 
+    def _check_hex_fused(self, h: HexTile) -> ValidationResult:
+        """All per-hex checks in one pass, via the terrain's ``_HEX_RULES`` entry."""
+        return _apply_rules(h, _HEX_RULES)
+
     def _check_terrain_elevation(self, h: HexTile) -> ValidationResult:
         """Mountains should be high elevation, water should be low."""
-        result = ValidationResult(valid=True)
-
-        if h.terrain == TerrainType.MOUNTAINS and h.elevation < 0.7:
-            result.add_error(f"Mountains must have elevation >= 0.7, got {h.elevation}")
-
-        if h.terrain == TerrainType.WATER and h.elevation > 0.3:
-            result.add_error(f"Water must have elevation <= 0.3, got {h.elevation}")
-
-        if h.terrain == TerrainType.HILLS and not (0.4 <= h.elevation <= 0.8):
-            result.add_warning(f"Hills typically have elevation 0.4-0.8, got {h.elevation}")
-
-        return result
+        return _apply_rules(h, _ELEVATION_RULES)
 
     def _check_terrain_moisture(self, h: HexTile) -> ValidationResult:
         """Desert should be dry, swamp should be wet."""
-        result = ValidationResult(valid=True)
-
-        if h.terrain == TerrainType.DESERT and h.moisture > 0.2:
-            result.add_error(f"Desert must have moisture <= 0.2, got {h.moisture}")
-
-        if h.terrain == TerrainType.SWAMP and h.moisture < 0.7:
-            result.add_error(f"Swamp must have moisture >= 0.7, got {h.moisture}")
-
-        if h.terrain == TerrainType.WATER and h.moisture < 1.0:
-            result.add_warning(f"Water typically has moisture 1.0, got {h.moisture}")
-
-        return result
+        return _apply_rules(h, _MOISTURE_RULES)
 
     def _check_traversability(self, h: HexTile) -> ValidationResult:
         """Mountains with very high elevation should be impassable."""
-        result = ValidationResult(valid=True)
-
-        if h.terrain == TerrainType.MOUNTAINS and h.elevation > 0.95 and h.traversable:
-            result.add_warning("Very high mountains (>0.95) are usually impassable")
-
-        if h.terrain == TerrainType.WATER and h.traversable:
-            result.add_warning("Water hexes are typically not traversable by land units")
-
-        return result
+        return _apply_rules(h, _TRAVERSABILITY_RULES)
 
     def _check_resource_limits(self, h: HexTile) -> ValidationResult:
         """Check resource distribution makes sense."""
-        result = ValidationResult(valid=True)
+        return _apply_rules(h, _RESOURCE_RULES)
 
-        if len(h.resources) > 3:
-            result.add_error(f"Max 3 resources per hex, got {len(h.resources)}")
-
-        from schemas import ResourceType
-        if h.terrain == TerrainType.WATER:
-            land_resources = [r for r in h.resources if r.type not in [ResourceType.FISH]]
-            if land_resources:
-                result.add_warning(f"Water hex has land resources: {[r.type.value for r in land_resources]}")
-
-        return result
+    # Region checks. The _check_* methods take a region; validate_region calls
+    # the column versions directly so hex attributes are read only once.
 
     def _check_unique_coordinates(self, region: HexRegion) -> ValidationResult:
         """All hex coordinates in a region must be unique."""
+        return self._unique_coordinates(_RegionColumns.of(region))
+
+    def _check_connectivity(self, region: HexRegion) -> ValidationResult:
+        """Check that all hexes are connected (optional, warning only).
+
+        Hexes not reachable from the one with the lowest packed coordinate key
+        are reported as disconnected.
+        """
+        return self._connectivity(_RegionColumns.of(region))
+
+    def _check_terrain_distribution(self, region: HexRegion) -> ValidationResult:
+        """Check terrain variety is reasonable."""
+        return self._terrain_distribution(_RegionColumns.of(region))
+
+    def _unique_coordinates(self, cols: _RegionColumns) -> ValidationResult:
         result = ValidationResult(valid=True)
 
-        coords = [(h.q, h.r) for h in region.hexes]
-        seen = set()
-        for coord in coords:
-            if coord in seen:
-                result.add_error(f"Duplicate coordinates: {coord}")
-            seen.add(coord)
+        coords = list(zip(cols.qs, cols.rs))
+        seen = self._scratch(self._scratch_seen)
+        seen.update(coords)
+        if len(seen) == len(coords):
+            return result
+
+        for coord, count in Counter(coords).items():
+            if count > 1:
+                result.add_error("Duplicate coordinates: {} ({} hexes)", coord, count)
 
         return result
 
-    def _check_connectivity(self, region: HexRegion) -> ValidationResult:
-        """Check that all hexes are connected (optional, warning only)."""
+    def _connectivity(self, cols: _RegionColumns) -> ValidationResult:
         result = ValidationResult(valid=True)
 
-        if len(region.hexes) < 2:
+        if len(cols.qs) < 2:
             return result
 
-        coords = {(h.q, h.r) for h in region.hexes}
+        if HAS_NUMBA:
+            keys = np.unique(pack_key(
+                np.array(cols.qs, dtype=np.int64), np.array(cols.rs, dtype=np.int64)
+            ))
+            disconnected = len(keys) - connected_count(keys)
+            if disconnected:
+                result.add_warning("Region has {} disconnected hexes", disconnected)
+            return result
 
-        def neighbors(q: int, r: int) -> list[tuple[int, int]]:
-            return [
-                (q + 1, r), (q - 1, r),
-                (q, r + 1), (q, r - 1),
-                (q + 1, r - 1), (q - 1, r + 1),
-            ]
+        coords = set(zip(cols.qs, cols.rs))
 
-        start = next(iter(coords))
-        visited = {start}
-        frontier = [start]
+        # Same start hex as the compiled path: the lowest packed key
+        start = min(coords, key=lambda c: pack_key(*c))
+        visited = self._scratch(self._scratch_visited)
+        visited.add(start)
+        frontier = self._scratch(self._scratch_frontier)
+        frontier.append(start)
 
         while frontier:
-            current = frontier.pop()
-            for neighbor in neighbors(*current):
-                if neighbor in coords and neighbor not in visited:
-                    visited.add(neighbor)
-                    frontier.append(neighbor)
+            cq, cr = frontier.popleft()
+            for dq, dr in _HEX_NEIGHBOR_OFFSETS:
+                nb = (cq + dq, cr + dr)
+                if nb in coords and nb not in visited:
+                    visited.add(nb)
+                    frontier.append(nb)
 
-        if len(visited) != len(coords):
-            disconnected = coords - visited
-            result.add_warning(f"Region has {len(disconnected)} disconnected hexes")
+        disconnected = len(coords) - len(visited)
+        if disconnected:
+            result.add_warning("Region has {} disconnected hexes", disconnected)
 
         return result
 
-    def _check_terrain_distribution(self, region: HexRegion) -> ValidationResult:
-        """Check terrain variety is reasonable."""
+    def _terrain_distribution(self, cols: _RegionColumns) -> ValidationResult:
         result = ValidationResult(valid=True)
 
-        terrain_counts: dict[TerrainType, int] = {}
-        for h in region.hexes:
-            terrain_counts[h.terrain] = terrain_counts.get(h.terrain, 0) + 1
+        total = len(cols.terrains)
+        if total <= 5:
+            return result
 
-        total = len(region.hexes)
-        for terrain, count in terrain_counts.items():
-            ratio = count / total
-            if ratio > 0.8 and total > 5:
-                result.add_warning(f"Region is {ratio*100:.0f}% {terrain.value} - limited variety")
+        # Only the most common terrain can exceed 80%
+        terrain, count = Counter(cols.terrains).most_common(1)[0]
+        ratio = count / total
+        if ratio > 0.8:
+            result.add_warning("Region is {:.0f}% {} - limited variety", ratio*100, terrain.value)
 
         return result
 
+    # Unbound, so instances share it; call as check(self, cols)
+    _REGION_CHECKS: tuple[Callable[["HexValidator", _RegionColumns], ValidationResult], ...] = (
+        _unique_coordinates,
+        _connectivity,
+        _terrain_distribution,
+    )
+
+
+_DEFAULT_VALIDATOR: HexValidator | None = None
+
 
 def quick_validate(region: HexRegion) -> bool:
     """Fast validation check - returns True if valid."""
-    validator = HexValidator()
-    result = validator.validate_region(region)
-    return result.valid
+    global _DEFAULT_VALIDATOR
+    if _DEFAULT_VALIDATOR is None:
+        _DEFAULT_VALIDATOR = HexValidator()
+    return _DEFAULT_VALIDATOR.validate_region(region, short_circuit=True).valid